@@ -11,6 +11,9 @@ from utils.check_macos_requirements import check_macos_requirements
 from utils.setup_driver import setup_driver
 from utils.extraction.scrape_and_process_jobs import scrape_and_process_jobs
 from utils.navigation.login_to_linkedin import login_to_linkedin
+from utils.page_archive import PageArchive
+from utils.accounts.account_pool import AccountPool
+from utils.accounts.session_rotator import SessionRotator
 
 
 def setup_logging():
@@ -23,7 +26,11 @@ def setup_logging():
 
 
 def load_config() -> dict:
-    """Load and validate environment variables."""
+    """Load and validate environment variables.
+
+    LINKEDIN_ACCOUNTS_FILE replaces the single LINKEDIN_USERNAME/LINKEDIN_PASSWORD
+    pair with a pool of accounts.
+    """
     load_dotenv(override=True)
     config = {
         "SUPABASE_URL": os.getenv("SUPABASE_URL"),
@@ -31,21 +38,26 @@ def load_config() -> dict:
         "LINKEDIN_USERNAME": os.getenv("LINKEDIN_USERNAME"),
         "LINKEDIN_PASSWORD": os.getenv("LINKEDIN_PASSWORD"),
     }
-    missing = [k for k, v in config.items() if not v]
+    accounts_file = os.getenv("LINKEDIN_ACCOUNTS_FILE")
+    optional = ("LINKEDIN_USERNAME", "LINKEDIN_PASSWORD") if accounts_file else ()
+    missing = [k for k, v in config.items() if not v and k not in optional]
     if missing:
         raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+    config["LINKEDIN_ACCOUNTS_FILE"] = accounts_file
     return config
 
 
 def get_chrome_config() -> dict:
     """Return Chrome profile and binary config based on OS."""
     is_macos = platform.system() == "Darwin"
+    capture_network = os.getenv("CAPTURE_NETWORK", "").lower() in ("1", "true", "yes")
     if is_macos:
         return {
             "IS_MACOS": True,
             "CHROME_USER_DATA_DIR": "/Users/macmini/Library/Application Support/Google/Chrome/",
             "DEFAULT_PROFILE": "Profile 3",
             "CHROME_BINARY_PATHS": "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            "CAPTURE_NETWORK": capture_network,
         }
     else:
         return {
@@ -53,9 +65,34 @@ def get_chrome_config() -> dict:
             "CHROME_USER_DATA_DIR": None,
             "DEFAULT_PROFILE": "Default",
             "CHROME_BINARY_PATHS": [],
+            "CAPTURE_NETWORK": capture_network,
         }
 
 
+def start_single_session(config: dict, chrome_cfg: dict):
+    """Launch Chrome with the configured profile and log in to the single account."""
+    logging.info("🔧 Setting up Chrome driver...")
+    driver = setup_driver(
+        chrome_cfg["IS_MACOS"],
+        chrome_cfg["CHROME_USER_DATA_DIR"],
+        chrome_cfg["DEFAULT_PROFILE"],
+        chrome_cfg["CHROME_BINARY_PATHS"],
+        capture_network=chrome_cfg["CAPTURE_NETWORK"],
+    )
+
+    if not driver:
+        logging.error("Failed to setup Chrome driver. Exiting...")
+        return None
+
+    logging.info("🔐 Logging into LinkedIn...")
+    login_to_linkedin(
+        driver,
+        config["LINKEDIN_USERNAME"],
+        config["LINKEDIN_PASSWORD"],
+    )
+    return driver
+
+
 async def main() -> None:
     """Main function to run the LinkedIn Lead Generator script."""
     setup_logging()
@@ -67,6 +104,10 @@ async def main() -> None:
         chrome_cfg = get_chrome_config()
         supabase: Client = create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
 
+        # Optionally keep raw page sources for offline re-extraction
+        archive_dir = os.getenv("PAGE_ARCHIVE_DIR")
+        archive = PageArchive(archive_dir) if archive_dir else None
+
         # Check macOS requirements
         if not check_macos_requirements(
             chrome_cfg["IS_MACOS"],
@@ -78,25 +119,16 @@ async def main() -> None:
             return
 
         driver: Optional[object] = None
+        rotator: Optional[SessionRotator] = None
         try:
-            logging.info("🔧 Setting up Chrome driver...")
-            driver = setup_driver(
-                chrome_cfg["IS_MACOS"],
-                chrome_cfg["CHROME_USER_DATA_DIR"],
-                chrome_cfg["DEFAULT_PROFILE"],
-                chrome_cfg["CHROME_BINARY_PATHS"],
-            )
-
-            if not driver:
-                logging.error("Failed to setup Chrome driver. Exiting...")
-                return
-
-            logging.info("🔐 Logging into LinkedIn...")
-            login_to_linkedin(
-                driver,
-                config["LINKEDIN_USERNAME"],
-                config["LINKEDIN_PASSWORD"],
-            )
+            if config["LINKEDIN_ACCOUNTS_FILE"]:
+                account_pool = AccountPool.from_file(config["LINKEDIN_ACCOUNTS_FILE"])
+                logging.info(f"👥 Rotating across {len(account_pool.accounts)} LinkedIn accounts")
+                rotator = SessionRotator(account_pool, chrome_cfg)
+            else:
+                driver = start_single_session(config, chrome_cfg)
+                if not driver:
+                    return
 
             # List of job search URLs to process
             urls = [
@@ -108,7 +140,15 @@ async def main() -> None:
             for i, url in enumerate(urls, 1):
                 logging.info(f"📋 Processing job search URL {i}/{len(urls)}")
                 logging.info(f"🔗 {url}")
-                await scrape_and_process_jobs(driver, url, max_items=100, supabase=supabase)
+                await scrape_and_process_jobs(
+                    driver,
+                    url,
+                    max_items=100,
+                    supabase=supabase,
+                    archive=archive,
+                    network_capture=chrome_cfg["CAPTURE_NETWORK"],
+                    rotator=rotator,
+                )
 
             logging.info("✅ Script completed successfully!")
 
@@ -130,6 +170,9 @@ async def main() -> None:
                     logging.info("🔒 Chrome driver closed successfully")
                 except Exception as e:
                     logging.warning(f"Error closing driver: {e}")
+            if rotator:
+                rotator.close()
+                logging.info("🔒 Account browsers closed")
 
     except Exception as e:
         logging.critical(f"Fatal error during setup: {e}")
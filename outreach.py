@@ -0,0 +1,78 @@
+import argparse
+import logging
+import os
+
+from dotenv import load_dotenv
+from supabase import Client, create_client
+
+from main import setup_logging
+from utils.outreach.collect_recipients import collect_recipients
+from utils.outreach.sent_log import SentLog, DEFAULT_SENT_LOG_PATH
+from utils.outreach.ses_sender import (
+    create_ses_client,
+    ensure_template,
+    get_send_limits,
+    send_outreach,
+)
+from utils.outreach.templates import DEFAULT_TEMPLATE
+
+
+def load_outreach_config() -> dict:
+    """Load and validate environment variables for sending email."""
+    load_dotenv(override=True)
+    config = {
+        "SUPABASE_URL": os.getenv("SUPABASE_URL"),
+        "SUPABASE_KEY": os.getenv("SUPABASE_KEY"),
+        "AWS_REGION": os.getenv("AWS_REGION"),
+        "AWS_ACCESS_KEY": os.getenv("AWS_ACCESS_KEY"),
+        "AWS_SECRET_KEY": os.getenv("AWS_SECRET_KEY"),
+        "SENDER_EMAIL": os.getenv("SENDER_EMAIL"),
+        "SENDER_NAME": os.getenv("SENDER_NAME"),
+    }
+    missing = [k for k, v in config.items() if not v]
+    if missing:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+    config["SES_ENDPOINT_URL"] = os.getenv("SES_ENDPOINT_URL")
+    return config
+
+
+def run_outreach(limit=None, senders=4, sent_log_path=DEFAULT_SENT_LOG_PATH, dry_run=False):
+    config = load_outreach_config()
+    supabase: Client = create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
+    ses = create_ses_client(config)
+    sent_log = SentLog(sent_log_path)
+    template_name = DEFAULT_TEMPLATE["TemplateName"]
+
+    send_rate, remaining_quota = get_send_limits(ses)
+    limit = remaining_quota if limit is None else min(limit, remaining_quota)
+    logging.info(f"📨 SES send rate {send_rate}/s, {remaining_quota} messages left today")
+
+    recipients = collect_recipients(supabase, sent_log, template_name, limit=limit)
+    logging.info(f"👥 {len(recipients)} new recruiters to contact")
+    if not recipients or dry_run:
+        return
+
+    ensure_template(ses, DEFAULT_TEMPLATE)
+    sent, failed = send_outreach(
+        ses,
+        recipients,
+        sent_log,
+        source=f"{config['SENDER_NAME']} <{config['SENDER_EMAIL']}>",
+        template_name=template_name,
+        sender_name=config["SENDER_NAME"],
+        send_rate=send_rate,
+        senders=senders,
+    )
+    logging.info(f"✅ Sent {sent} emails, {failed} failed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Email newly collected recruiters via SES")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--senders", type=int, default=4)
+    parser.add_argument("--sent-log", default=DEFAULT_SENT_LOG_PATH)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    setup_logging()
+    run_outreach(args.limit, args.senders, args.sent_log, args.dry_run)
@@ -0,0 +1,178 @@
+import argparse
+import logging
+
+from supabase import Client, create_client
+
+from main import load_config, setup_logging
+from utils.company_index import CompanyIndex, DEFAULT_INDEX_PATH
+from utils.normalize_company import (
+    LINKEDIN_COMPANY_URL,
+    domain_match_key,
+    linkedin_company_slug,
+    normalize_domain,
+)
+
+PAGE_SIZE = 1000
+
+
+def fetch_all(supabase: Client, table, columns):
+    rows = []
+    start = 0
+    while True:
+        response = (
+            supabase.table(table)
+            .select(columns)
+            .order("id")
+            .range(start, start + PAGE_SIZE - 1)
+            .execute()
+        )
+        rows.extend(response.data)
+        if len(response.data) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
+
+
+def group_duplicates(companies):
+    """Union companies that share a LinkedIn slug or a registrable domain.
+
+    Domains on shared hosts are ignored, and two groups whose LinkedIn slugs
+    are both set and different are never joined.
+    """
+    parent = {c["id"]: c["id"] for c in companies}
+    group_slugs = {
+        c["id"]: linkedin_company_slug(c["linkedin_url"]) for c in companies
+    }
+
+    def find(company_id):
+        while parent[company_id] != company_id:
+            parent[company_id] = parent[parent[company_id]]
+            company_id = parent[company_id]
+        return company_id
+
+    owners = {}
+    for company in companies:
+        for key in (
+            ("slug", linkedin_company_slug(company["linkedin_url"])),
+            ("domain", domain_match_key(normalize_domain(company["company_domain"]))),
+        ):
+            if not key[1]:
+                continue
+            if key not in owners:
+                owners[key] = company["id"]
+                continue
+            a, b = find(owners[key]), find(company["id"])
+            if a == b:
+                continue
+            slug_a, slug_b = group_slugs[a], group_slugs[b]
+            if slug_a and slug_b and slug_a != slug_b:
+                logging.info(
+                    f"⚠️ Not merging companies {a} and {b}: same {key[0]} {key[1]} "
+                    f"but LinkedIn slugs {slug_a} and {slug_b}"
+                )
+                continue
+            root, child = min(a, b), max(a, b)
+            parent[child] = root
+            group_slugs[root] = slug_a or slug_b
+
+    groups = {}
+    for company in companies:
+        groups.setdefault(find(company["id"]), []).append(company)
+    return groups
+
+
+def merge_group(supabase: Client, canonical, duplicates, dry_run):
+    """Repoint jobs to the canonical company, fill its gaps and delete the duplicates"""
+    update_data = {}
+    for field in ("name", "location", "company_domain", "metadata"):
+        if canonical.get(field) in (None, "", "{}"):
+            for duplicate in duplicates:
+                if duplicate.get(field) not in (None, "", "{}"):
+                    update_data[field] = duplicate[field]
+                    break
+
+    duplicate_ids = [d["id"] for d in duplicates]
+    logging.info(f"🔗 Merging companies {duplicate_ids} into {canonical['id']}")
+    if dry_run:
+        return update_data
+
+    supabase.table("linkedin_jobs").update({"company_id": canonical["id"]}).in_(
+        "company_id", duplicate_ids
+    ).execute()
+    supabase.table("companies").delete().in_("id", duplicate_ids).execute()
+    return update_data
+
+
+def rebuild_company_index(supabase: Client, index_path, dry_run=False):
+    companies = fetch_all(
+        supabase, "companies", "id, name, location, linkedin_url, company_domain, metadata"
+    )
+    logging.info(f"🏢 Loaded {len(companies)} companies")
+
+    index = CompanyIndex(index_path)
+    index.slugs, index.domains = {}, {}
+    merged = normalized = 0
+
+    for group in group_duplicates(companies).values():
+        group.sort(key=lambda c: c["id"])
+        canonical, duplicates = group[0], group[1:]
+        update_data = {}
+        if duplicates:
+            update_data = merge_group(supabase, canonical, duplicates, dry_run)
+            merged += len(duplicates)
+
+        # Store normalized keys on the surviving row
+        slugs = [linkedin_company_slug(c["linkedin_url"]) for c in group]
+        domains = [normalize_domain(c["company_domain"]) for c in group]
+        slug = next((s for s in slugs if s), None)
+        domain = next((d for d in domains if d), None)
+        if slug and canonical["linkedin_url"] != LINKEDIN_COMPANY_URL.format(slug=slug):
+            update_data["linkedin_url"] = LINKEDIN_COMPANY_URL.format(slug=slug)
+        if domain and canonical["company_domain"] != domain:
+            update_data["company_domain"] = domain
+
+        if update_data:
+            normalized += 1
+            if not dry_run:
+                supabase.table("companies").update(update_data).eq(
+                    "id", canonical["id"]
+                ).execute()
+
+        for company_slug, company_domain in zip(slugs, domains):
+            index.add(
+                canonical["id"], slug=company_slug, domain=company_domain, persist=False
+            )
+
+    # Recruiters carry the company domain too
+    recruiters = fetch_all(supabase, "recruiters", "id, company_domain")
+    recruiters_updated = 0
+    for recruiter in recruiters:
+        domain = normalize_domain(recruiter["company_domain"])
+        # Never replace a stored domain with nothing
+        if domain and domain != recruiter["company_domain"]:
+            recruiters_updated += 1
+            if not dry_run:
+                supabase.table("recruiters").update({"company_domain": domain}).eq(
+                    "id", recruiter["id"]
+                ).execute()
+
+    if not dry_run:
+        index.save()
+    logging.info(
+        f"✅ Merged {merged} duplicate companies, normalized {normalized} companies "
+        f"and {recruiters_updated} recruiters; index has {len(index.slugs)} slugs "
+        f"and {len(index.domains)} domains"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild the local company index and merge duplicate companies"
+    )
+    parser.add_argument("--index-path", default=DEFAULT_INDEX_PATH)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    setup_logging()
+    config = load_config()
+    supabase: Client = create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
+    rebuild_company_index(supabase, args.index_path, args.dry_run)
@@ -0,0 +1,129 @@
+import argparse
+import json
+import logging
+import os
+from multiprocessing import Pool
+
+from supabase import Client, create_client
+
+from main import load_config, setup_logging
+from utils.page_archive import PageArchive, DEFAULT_ARCHIVE_DIR
+from utils.normalize_company import canonical_linkedin_company_url, normalize_domain
+from utils.extraction.parse_page_source import parse_job_page, parse_company_page
+
+
+def parse_entry(task):
+    """Parse one archived page; runs inside a worker process"""
+    archive_dir, entry = task
+    try:
+        page_source = PageArchive(archive_dir).read(entry["sha256"])
+        if entry["kind"] == "job":
+            return entry, parse_job_page(page_source), None
+        return entry, parse_company_page(page_source), None
+    except Exception as e:
+        return entry, None, str(e)
+
+
+def _is_empty(value):
+    return value in (None, "", {}, [])
+
+
+def backfill_job(supabase: Client, job_id, record):
+    """Fill gaps in a stored job from a re-parsed page.
+
+    Only empty fields and role_metadata keys are written, so values captured
+    from LinkedIn's API (extras, applicant counts, full descriptions) are kept.
+    """
+    response = (
+        supabase.table("linkedin_jobs")
+        .select("title, description, role_metadata")
+        .eq("id", int(job_id))
+        .execute()
+    )
+    if not response.data:
+        return False
+    existing = response.data[0]
+
+    update_data = {}
+    if record["title"] and _is_empty(existing.get("title")):
+        update_data["title"] = record["title"]
+    if record["job_details"] and _is_empty(existing.get("description")):
+        update_data["description"] = record["job_details"]
+
+    role_metadata = existing.get("role_metadata") or {}
+    if isinstance(role_metadata, str):
+        role_metadata = json.loads(role_metadata)
+    missing = {
+        key: value
+        for key, value in record["role_metadata"].items()
+        if not _is_empty(value) and _is_empty(role_metadata.get(key))
+    }
+    if missing:
+        update_data["role_metadata"] = {**role_metadata, **missing}
+
+    if update_data:
+        supabase.table("linkedin_jobs").update(update_data).eq(
+            "id", int(job_id)
+        ).execute()
+    return bool(update_data)
+
+
+def backfill_company(supabase: Client, company_url, record):
+    update_data = {}
+    company_domain = normalize_domain(record["company_domain"])
+    if company_domain:
+        update_data["company_domain"] = company_domain
+    if record["company_details"] and record["company_details"] != "{}":
+        update_data["metadata"] = record["company_details"]
+    if update_data:
+        supabase.table("companies").update(update_data).eq(
+            "linkedin_url", canonical_linkedin_company_url(company_url)
+        ).execute()
+    return bool(update_data)
+
+
+def reextract(supabase: Client, archive_dir, kind=None, workers=None, dry_run=False):
+    """Re-parse archived pages in parallel and backfill Supabase"""
+    archive = PageArchive(archive_dir)
+    entries = archive.entries(kind)
+    logging.info(f"📦 Re-extracting {len(entries)} archived pages from {archive_dir}")
+
+    updated = failed = 0
+    tasks = [(archive_dir, entry) for entry in entries]
+    with Pool(processes=workers) as pool:
+        for entry, record, error in pool.imap_unordered(parse_entry, tasks, chunksize=16):
+            if error:
+                failed += 1
+                logging.warning(f"Failed to parse {entry['kind']} {entry['key']}: {error}")
+                continue
+            if dry_run:
+                logging.info(f"{entry['kind']} {entry['key']}: {record}")
+                continue
+            try:
+                if entry["kind"] == "job":
+                    changed = backfill_job(supabase, entry["key"], record)
+                else:
+                    changed = backfill_company(supabase, entry["key"], record)
+                updated += int(changed)
+            except Exception as e:
+                failed += 1
+                logging.warning(f"Failed to backfill {entry['kind']} {entry['key']}: {e}")
+
+    logging.info(f"✅ Backfilled {updated} rows, {failed} failures")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-extract archived LinkedIn pages")
+    parser.add_argument(
+        "--archive-dir",
+        default=os.getenv("PAGE_ARCHIVE_DIR") or DEFAULT_ARCHIVE_DIR,
+    )
+    parser.add_argument("--kind", choices=["job", "company"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    setup_logging()
+    config = load_config()
+    supabase: Client = create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
+    reextract(supabase, args.archive_dir, args.kind, args.workers, args.dry_run)
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, Field
+from supabase import Client, create_client
+
+from main import get_chrome_config, load_config, setup_logging
+from utils.check_macos_requirements import check_macos_requirements
+from utils.company_index import CompanyIndex
+from utils.missing_sections_cache import MissingSectionsCache
+from utils.page_archive import PageArchive
+from utils.accounts.account_pool import AccountPool
+from utils.accounts.session_rotator import SessionRotator
+from utils.service.browser_pool import BrowserPool
+from utils.service.job_queue import DEFAULT_SHUTDOWN_TIMEOUT, JobQueue
+
+
+class ScrapeRequest(BaseModel):
+    search_url: str
+    max_items: int = Field(default=100, ge=1, le=1000)
+    priority: int = 0
+
+
+class EnrichRequest(BaseModel):
+    job_id: str = Field(pattern=r"^\d+$")
+    # On-demand lookups jump ahead of bulk scrapes by default
+    priority: int = 10
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the warm browser pool and its workers once for the life of the service"""
+    setup_logging()
+    config = load_config()
+    chrome_cfg = get_chrome_config()
+    if not check_macos_requirements(
+        chrome_cfg["IS_MACOS"],
+        chrome_cfg["CHROME_USER_DATA_DIR"],
+        chrome_cfg["DEFAULT_PROFILE"],
+        chrome_cfg["CHROME_BINARY_PATHS"],
+    ):
+        raise RuntimeError("System requirements not met. Please resolve the issues above.")
+
+    supabase: Client = create_client(config["SUPABASE_URL"], config["SUPABASE_KEY"])
+    archive_dir = os.getenv("PAGE_ARCHIVE_DIR")
+    archive = PageArchive(archive_dir) if archive_dir else None
+    # One copy of each on-disk cache for all workers, so saves do not clobber each other
+    shared = {
+        "archive": archive,
+        "missing_sections": MissingSectionsCache(),
+        "company_index": CompanyIndex(),
+    }
+
+    pool_size = int(os.getenv("SCRAPER_POOL_SIZE", "1"))
+    loop = asyncio.get_running_loop()
+    app.state.jobs = JobQueue()
+
+    if config["LINKEDIN_ACCOUNTS_FILE"]:
+        # One warm browser per account; jobs lease whichever account has quota left
+        account_pool = AccountPool.from_file(config["LINKEDIN_ACCOUNTS_FILE"])
+        rotator = SessionRotator(account_pool, chrome_cfg)
+        logging.info(f"🔧 Warming up browsers for {len(account_pool.accounts)} accounts...")
+        await loop.run_in_executor(None, rotator.start_all)
+        app.state.pool = account_pool
+        workers = [
+            asyncio.create_task(
+                app.state.jobs.run_worker(None, supabase, rotator=rotator, **shared)
+            )
+            for _ in range(min(pool_size, len(account_pool.accounts)))
+        ]
+        stop = rotator.close
+    else:
+        pool = BrowserPool(pool_size, chrome_cfg, config)
+        logging.info(f"🔧 Warming up {len(pool.slots)} browser(s)...")
+        await loop.run_in_executor(None, pool.start)
+        app.state.pool = pool
+        workers = [
+            asyncio.create_task(app.state.jobs.run_worker(slot, supabase, **shared))
+            for slot in pool.slots
+        ]
+        stop = pool.stop
+
+    logging.info("✅ Scraper service ready")
+    try:
+        yield
+    finally:
+        await app.state.jobs.shutdown(
+            workers,
+            timeout=float(
+                os.getenv("SERVICE_SHUTDOWN_TIMEOUT", DEFAULT_SHUTDOWN_TIMEOUT)
+            ),
+        )
+        stop()
+        logging.info("🔒 Browsers closed")
+
+
+app = FastAPI(title="LinkedIn Lead Generator", lifespan=lifespan)
+
+
+def submit_job(kind, params, priority):
+    try:
+        job = app.state.jobs.submit(kind, params, priority)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return job.to_dict()
+
+
+@app.post("/scrape", status_code=202)
+async def submit_scrape(request: ScrapeRequest):
+    return submit_job(
+        "scrape",
+        {"search_url": request.search_url, "max_items": request.max_items},
+        request.priority,
+    )
+
+
+@app.post("/enrich", status_code=202)
+async def submit_enrich(request: EnrichRequest):
+    return submit_job("enrich", {"job_id": request.job_id}, request.priority)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = app.state.jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
+
+
+@app.get("/jobs")
+async def list_jobs(status: Optional[str] = None):
+    return [
+        job.to_dict()
+        for job in app.state.jobs.jobs.values()
+        if status is None or job.status == status
+    ]
+
+
+@app.get("/health")
+async def health():
+    return {"pool": app.state.pool.stats(), **app.state.jobs.stats()}
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        app,
+        host=os.getenv("SERVICE_HOST", "127.0.0.1"),
+        port=int(os.getenv("SERVICE_PORT", "8000")),
+    )
@@ -0,0 +1,42 @@
+import os
+
+from utils.extraction.map_voyager_responses import map_voyager_responses
+from utils.extraction.network_capture import load_responses
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "voyager_capture.json")
+
+
+def test_maps_job_company_and_hirer():
+    records = map_voyager_responses(load_responses(FIXTURE))
+
+    assert records["3843718022"] == {
+        "title": "Senior Backend Engineer",
+        "job_details": (
+            "Acme Robotics is hiring a Senior Backend Engineer to build the services "
+            "behind our warehouse fleet."
+        ),
+        "company_location": "Austin, TX",
+        "applicants": "57 applicants",
+        "company_name": "Acme Robotics",
+        "company_url": "https://www.linkedin.com/company/acme-robotics",
+        "hiring_manager_name": "Jane Doe",
+        "hiring_manager_linkedin_url": "https://www.linkedin.com/in/jane-doe-4b1a2",
+        "extra": {
+            "employment_status": "Full-time",
+            "experience_level": "Mid-Senior level",
+            "industries": ["Robotics Engineering"],
+            "job_functions": ["Engineering", "Information Technology"],
+            "workplace_types": ["urn:li:fs_workplaceType:3"],
+            "remote_allowed": True,
+            "job_state": "LISTED",
+            "listed_at": "2023-11-14T22:13:20+00:00",
+        },
+    }
+
+
+def test_search_cards_do_not_create_records():
+    records = map_voyager_responses(load_responses(FIXTURE))
+
+    # Only postings are mapped; the cards and composite hiring-team urns are not job ids
+    assert set(records) == {"3843718022", "3851122334"}
+    assert records["3851122334"] == {"title": "Data Engineer", "extra": {}}
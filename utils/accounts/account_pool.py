@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+from datetime import date
+
+DEFAULT_STATE_PATH = os.path.join(".cache", "accounts_state.json")
+DEFAULT_PROFILE_ROOT = os.path.join(".cache", "account-profiles")
+
+DEFAULT_DAILY_SEARCH_PAGES = 40
+DEFAULT_DAILY_JOB_VIEWS = 600
+# Consecutive failures after which an account is rested for the rest of the day
+MAX_CONSECUTIVE_FAILURES = 3
+
+QUOTA_KINDS = ("search_pages", "job_views")
+
+
+class Account:
+    """One LinkedIn login with its own Chrome profile, cookies and daily quotas"""
+
+    def __init__(
+        self,
+        username,
+        password,
+        profile_dir=None,
+        daily_search_pages=DEFAULT_DAILY_SEARCH_PAGES,
+        daily_job_views=DEFAULT_DAILY_JOB_VIEWS,
+    ):
+        self.username = username
+        self.password = password
+        self.profile_dir = profile_dir or os.path.join(
+            DEFAULT_PROFILE_ROOT, username.replace("@", "_at_")
+        )
+        self.quotas = {
+            "search_pages": daily_search_pages,
+            "job_views": daily_job_views,
+        }
+
+
+class AccountPool:
+    """Tracks usage, health and retirement of a set of accounts, persisted across runs"""
+
+    def __init__(self, accounts, state_path=DEFAULT_STATE_PATH):
+        self.accounts = {account.username: account for account in accounts}
+        self.state_path = state_path
+        self.state = {}
+        self.leased = set()
+        self.lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_file(cls, path, state_path=DEFAULT_STATE_PATH):
+        """Load accounts from a JSON list of {username, password, profile_dir?, daily_*?}"""
+        with open(path, "r") as f:
+            entries = json.load(f)
+        return cls([Account(**entry) for entry in entries], state_path)
+
+    def _load(self):
+        try:
+            with open(self.state_path, "r") as f:
+                self.state = json.load(f)
+        except FileNotFoundError:
+            self.state = {}
+        except (ValueError, OSError) as e:
+            print(f"Could not read account state, starting fresh: {e}")
+            self.state = {}
+
+    def _save(self):
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _account_state(self, username):
+        """State for today; usage counters and failures reset at the start of each day"""
+        today = date.today().isoformat()
+        state = self.state.setdefault(username, {"retired": False})
+        if state.get("day") != today:
+            state.update({"day": today, "failures": 0})
+            state.update({kind: 0 for kind in QUOTA_KINDS})
+        return state
+
+    def remaining(self, account, kind):
+        state = self._account_state(account.username)
+        return max(0, account.quotas[kind] - state[kind])
+
+    def is_healthy(self, account):
+        state = self._account_state(account.username)
+        return not state["retired"] and state["failures"] < MAX_CONSECUTIVE_FAILURES
+
+    def lease(self, kind, amount=1, job_views=0):
+        """Reserve the healthy, idle account with the most remaining quota for `kind`.
+
+        `job_views` is the number of job views the caller expects to make with the
+        account. Returns None when no account has enough quota left.
+        """
+        with self.lock:
+            candidates = []
+            for account in self.accounts.values():
+                if account.username in self.leased or not self.is_healthy(account):
+                    continue
+                if self.remaining(account, kind) < amount:
+                    continue
+                if job_views and self.remaining(account, "job_views") < job_views:
+                    continue
+                share = self.remaining(account, kind) / account.quotas[kind]
+                candidates.append((share, self.remaining(account, "job_views"), account))
+            if not candidates:
+                return None
+            candidates.sort(key=lambda c: (c[0], c[1]), reverse=True)
+            account = candidates[0][2]
+            self.leased.add(account.username)
+            return account
+
+    def release(self, account):
+        with self.lock:
+            self.leased.discard(account.username)
+
+    def record(self, account, kind, amount=1):
+        with self.lock:
+            state = self._account_state(account.username)
+            state[kind] += amount
+            state["failures"] = 0
+            self._save()
+
+    def report_failure(self, account, reason):
+        with self.lock:
+            state = self._account_state(account.username)
+            state["failures"] += 1
+            print(f"[WARN] Account {account.username} failed ({state['failures']}): {reason}")
+            self._save()
+
+    def retire(self, account, reason):
+        """Take an account out of rotation until it is manually reinstated"""
+        with self.lock:
+            state = self._account_state(account.username)
+            state["retired"] = True
+            state["retired_reason"] = reason
+            print(f"[WARN] Retiring account {account.username}: {reason}")
+            self._save()
+
+    def stats(self):
+        with self.lock:
+            return {
+                username: {
+                    "retired": self._account_state(username)["retired"],
+                    "leased": username in self.leased,
+                    **{
+                        f"remaining_{kind}": self.remaining(account, kind)
+                        for kind in QUOTA_KINDS
+                    },
+                }
+                for username, account in self.accounts.items()
+            }
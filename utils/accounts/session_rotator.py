@@ -0,0 +1,167 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from ..check_captcha import is_challenged
+from ..navigation.login_to_linkedin import login_to_linkedin
+from ..setup_driver import setup_driver
+
+DEFAULT_COOKIE_DIR = os.path.join(".cache", "cookies")
+FEED_URL = "https://www.linkedin.com/feed/"
+# Accounts get their own debugging ports so their browsers can run side by side
+BASE_DEBUGGING_PORT = 9300
+
+
+def save_cookies(driver, path):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(driver.get_cookies(), f)
+    except Exception as e:
+        print(f"[WARN] Could not save cookies to {path}: {e}")
+
+
+def load_cookies(driver, path):
+    """Restore saved cookies into the browser; returns True if any were loaded"""
+    try:
+        with open(path, "r") as f:
+            cookies = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return False
+
+    # Cookies can only be set for the domain currently loaded
+    driver.get("https://www.linkedin.com/")
+    loaded = 0
+    for cookie in cookies:
+        cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+            loaded += 1
+        except Exception:
+            continue
+    return loaded > 0
+
+
+def is_logged_in(driver):
+    url = driver.current_url or ""
+    return "linkedin.com" in url and not any(
+        marker in url for marker in ("/login", "/uas/", "/authwall", "/checkpoint/")
+    )
+
+
+class SessionRotator:
+    """Hands out logged-in browser sessions across an AccountPool by remaining quota.
+
+    Each account keeps its own Chrome profile dir and cookie file, and its browser
+    stays open between leases. Challenged accounts are retired from the pool.
+    """
+
+    def __init__(self, account_pool, chrome_cfg, cookie_dir=DEFAULT_COOKIE_DIR):
+        self.pool = account_pool
+        self.chrome_cfg = chrome_cfg
+        self.cookie_dir = cookie_dir
+        self.drivers = {}
+        self.ports = {
+            username: BASE_DEBUGGING_PORT + i
+            for i, username in enumerate(account_pool.accounts)
+        }
+
+    def _cookie_path(self, account):
+        return os.path.join(self.cookie_dir, f"{account.username.replace('@', '_at_')}.json")
+
+    def _close(self, account):
+        driver = self.drivers.pop(account.username, None)
+        if driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"[WARN] Error closing driver for {account.username}: {e}")
+
+    def _start(self, account):
+        """Open the account's browser and log in, reusing saved cookies when possible"""
+        profile_dir = os.path.abspath(account.profile_dir)
+        os.makedirs(profile_dir, exist_ok=True)
+        driver = setup_driver(
+            self.chrome_cfg["IS_MACOS"],
+            profile_dir,
+            "Default",
+            self.chrome_cfg["CHROME_BINARY_PATHS"],
+            remote_debugging_port=self.ports[account.username],
+            capture_network=self.chrome_cfg.get("CAPTURE_NETWORK", False),
+        )
+        if not driver:
+            return None
+        self.drivers[account.username] = driver
+
+        if load_cookies(driver, self._cookie_path(account)):
+            driver.get(FEED_URL)
+            time.sleep(2)
+        if not is_logged_in(driver):
+            login_to_linkedin(driver, account.username, account.password, interactive=False)
+        return driver
+
+    def _ensure_session(self, account):
+        driver = self.drivers.get(account.username)
+        try:
+            if driver:
+                driver.window_handles
+            else:
+                driver = self._start(account)
+        except Exception as e:
+            print(f"[WARN] Browser for {account.username} is unresponsive, restarting: {e}")
+            self._close(account)
+            driver = self._start(account)
+
+        if driver is None:
+            self.pool.report_failure(account, "could not start Chrome")
+            return None
+        if is_challenged(driver):
+            self.pool.retire(account, f"security challenge at {driver.current_url}")
+            self._close(account)
+            return None
+        if not is_logged_in(driver):
+            self.pool.report_failure(account, f"not logged in ({driver.current_url})")
+            self._close(account)
+            return None
+
+        save_cookies(driver, self._cookie_path(account))
+        return driver
+
+    @contextmanager
+    def session(self, kind, amount=1, job_views=0):
+        """Lease (account, driver) with quota for `kind`; yields None when all accounts are spent"""
+        while True:
+            account = self.pool.lease(kind, amount, job_views)
+            if account is None:
+                yield None
+                return
+            try:
+                driver = self._ensure_session(account)
+            except Exception as e:
+                self.pool.report_failure(account, str(e))
+                driver = None
+            if driver is not None:
+                break
+            self.pool.release(account)
+
+        try:
+            yield account, driver
+        finally:
+            if is_challenged(driver):
+                self.pool.retire(account, f"security challenge at {driver.current_url}")
+                self._close(account)
+            self.pool.release(account)
+
+    def start_all(self):
+        """Warm up a browser for every healthy account"""
+        for account in self.pool.accounts.values():
+            if self.pool.is_healthy(account):
+                try:
+                    self._ensure_session(account)
+                except Exception as e:
+                    self.pool.report_failure(account, str(e))
+
+    def close(self):
+        for account in list(self.pool.accounts.values()):
+            self._close(account)
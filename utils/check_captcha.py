@@ -13,3 +13,12 @@ def check_for_captcha(driver):
             input("Press Enter after solving the CAPTCHA...")
     except NoSuchElementException:
         pass
+
+
+def is_challenged(driver):
+    """Check whether LinkedIn is showing a security checkpoint or CAPTCHA"""
+    try:
+        url = driver.current_url or ""
+    except Exception:
+        return False
+    return "/checkpoint/" in url or "/challenge" in url or "captcha" in url.lower()
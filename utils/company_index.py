@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+
+from supabase import Client
+
+from .normalize_company import (
+    canonical_linkedin_company_url,
+    domain_match_key,
+    linkedin_company_slug,
+    normalize_domain,
+)
+
+DEFAULT_INDEX_PATH = os.path.join(".cache", "company_index.json")
+
+
+class CompanyIndex:
+    """Local map of canonical company keys (LinkedIn slug, registrable domain) to company ids.
+
+    One instance can be shared by concurrent jobs.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.slugs = {}
+        self.domains = {}
+        self.lock = threading.RLock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self.slugs = data.get("slugs", {})
+            self.domains = data.get("domains", {})
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError) as e:
+            print(f"Could not read company index, starting empty: {e}")
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self.lock:
+            with open(tmp_path, "w") as f:
+                json.dump({"slugs": self.slugs, "domains": self.domains}, f)
+            os.replace(tmp_path, self.path)
+
+    def lookup(self, slug=None, domain=None):
+        if slug and slug in self.slugs:
+            return self.slugs[slug]
+        if domain and domain in self.domains:
+            return self.domains[domain]
+        return None
+
+    def add(self, company_id, slug=None, domain=None, persist=True):
+        domain = domain_match_key(domain)
+        with self.lock:
+            changed = False
+            if slug and self.slugs.get(slug) != company_id:
+                self.slugs[slug] = company_id
+                changed = True
+            if domain and self.domains.get(domain) != company_id:
+                self.domains[domain] = company_id
+                changed = True
+            if changed and persist:
+                try:
+                    self.save()
+                except OSError as e:
+                    print(f"Could not persist company index: {e}")
+
+    def forget(self, company_id):
+        with self.lock:
+            self.slugs = {k: v for k, v in self.slugs.items() if v != company_id}
+            self.domains = {k: v for k, v in self.domains.items() if v != company_id}
+
+
+def _conflicts(row, slug):
+    """True if the row is a different LinkedIn company than `slug`"""
+    row_slug = linkedin_company_slug(row.get("linkedin_url"))
+    return bool(slug and row_slug and row_slug != slug)
+
+
+def find_company(
+    supabase: Client,
+    company_index,
+    linkedin_url=None,
+    company_domain=None,
+    columns="id",
+):
+    """Find a company row by canonical LinkedIn slug or registrable domain.
+
+    The local index is consulted first; database lookups use the normalized
+    keys, and any hit is added to the index for next time. Domains on shared
+    hosts are never matched, and a domain match is rejected when the row has
+    a different LinkedIn slug.
+    """
+    slug = linkedin_company_slug(linkedin_url)
+    domain = domain_match_key(normalize_domain(company_domain))
+    selected = [c.strip() for c in columns.split(",")]
+    for column in ("linkedin_url", "id"):
+        if column not in selected:
+            columns = f"{column}, {columns}"
+
+    company_id = company_index.lookup(slug, domain) if company_index else None
+    if company_id is not None:
+        response = (
+            supabase.table("companies").select(columns).eq("id", company_id).execute()
+        )
+        if response.data and not _conflicts(response.data[0], slug):
+            return response.data[0]
+        if not response.data:
+            # Stale entry, e.g. the row was merged away
+            company_index.forget(company_id)
+
+    row = None
+    if slug:
+        response = (
+            supabase.table("companies")
+            .select(columns)
+            .eq("linkedin_url", canonical_linkedin_company_url(linkedin_url))
+            .execute()
+        )
+        row = response.data[0] if response.data else None
+    if row is None and domain:
+        response = (
+            supabase.table("companies")
+            .select(columns)
+            .eq("company_domain", domain)
+            .execute()
+        )
+        row = next((r for r in response.data if not _conflicts(r, slug)), None)
+    if row is None:
+        return None
+
+    if company_index:
+        company_index.add(
+            row["id"],
+            slug=slug or linkedin_company_slug(row.get("linkedin_url")),
+            domain=domain or normalize_domain(row.get("company_domain")),
+        )
+    return row
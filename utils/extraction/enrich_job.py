@@ -0,0 +1,56 @@
+import os
+import time
+
+from supabase import Client
+
+from .network_capture import drain_network_responses, save_responses
+from .map_voyager_responses import map_voyager_responses
+from .process_job_data import process_job_data
+from ..job_dedup_index import JobDedupIndex
+
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+async def enrich_job(
+    driver, job_id, supabase: Client, network_capture=False, **process_kwargs
+):
+    """Open a single job posting, process it and return the stored job row.
+
+    Like scrape_and_process_jobs, near-duplicates are linked to their canonical
+    job through the dedup index and skip company enrichment and the recruiter upsert.
+    """
+    if network_capture:
+        drain_network_responses(driver)  # discard responses from earlier pages
+    driver.get(JOB_VIEW_URL.format(job_id=job_id))
+    time.sleep(2)
+
+    if network_capture:
+        responses = drain_network_responses(driver)
+        if os.getenv("NETWORK_CAPTURE_DIR"):
+            save_responses(responses, os.getenv("NETWORK_CAPTURE_DIR"))
+        process_kwargs["captured"] = map_voyager_responses(responses).get(str(job_id))
+
+    dedup_index = JobDedupIndex()
+    try:
+        (
+            hiring_manager_name,
+            hiring_manager_linkedin_url,
+            company_domain,
+        ) = await process_job_data(
+            driver, job_id, supabase, dedup_index=dedup_index, **process_kwargs
+        )
+    finally:
+        dedup_index.close()
+
+    job_response = (
+        supabase.table("linkedin_jobs")
+        .select("*, companies(*), recruiters(*)")
+        .eq("id", int(job_id))
+        .execute()
+    )
+    return {
+        "job": job_response.data[0] if job_response.data else None,
+        "hiring_manager_name": hiring_manager_name,
+        "hiring_manager_linkedin_url": hiring_manager_linkedin_url,
+        "company_domain": company_domain,
+    }
@@ -1,21 +1,35 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import json
 
+from .probe_selectors import probe_selectors
 
-def extract_company_details(driver):
+WEBSITE_SELECTORS = [
+    (By.XPATH, "//a[@target='_blank' and contains(@class, 'link-without-visited-state')]"),
+    (By.XPATH, "//dt[contains(normalize-space(.), 'Website')]/following-sibling::dd[1]//a"),
+]
+
+# Exact class list first, then looser fallbacks for markup variations
+ABOUT_SECTION_SELECTORS = [
+    (
+        By.XPATH,
+        "//section[@class='artdeco-card org-page-details-module__card-spacing artdeco-card org-about-module__margin-bottom']",
+    ),
+    (By.XPATH, "//section[contains(@class, 'org-about-module')]"),
+    (By.XPATH, "//section[contains(@class, 'artdeco-card') and .//dl/dt]"),
+]
+
+
+def extract_company_details(driver, section=None, timeout=10):
     """Extract company details from LinkedIn company page"""
     try:
-        wait = WebDriverWait(driver, 10)
-        section = wait.until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//section[@class='artdeco-card org-page-details-module__card-spacing artdeco-card org-about-module__margin-bottom']",
-                )
-            )
-        )
+        if section is None:
+            section = probe_selectors(
+                driver, {"about": ABOUT_SECTION_SELECTORS}, timeout
+            )["about"]
+        if section is None:
+            print("Company about section not found")
+            return json.dumps({})
+
         company_details = {}
         dt_elements = section.find_elements(By.XPATH, ".//dt")
         for dt in dt_elements:
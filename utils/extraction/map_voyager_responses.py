@@ -0,0 +1,173 @@
+import re
+from datetime import datetime, timezone
+
+COMPANY_URN_PREFIXES = (
+    "urn:li:fsd_company:",
+    "urn:li:fs_normalized_company:",
+    "urn:li:company:",
+)
+PROFILE_URN_PREFIXES = ("urn:li:fsd_profile:", "urn:li:fs_miniProfile:")
+JOB_URN_MARKERS = ("jobPosting:", "fs_normalized_jobPosting:")
+# Job id inside any urn, including composite ones such as
+# urn:li:fsd_jobHiringTeamMember:(urn:li:fsd_jobPosting:123,0)
+JOB_ID_IN_URN = re.compile(r"jobPosting(?:Card)?:\(?(\d+)")
+
+# Job posting fields that have no DOM counterpart; kept in role_metadata
+EXTRA_JOB_FIELDS = {
+    "formattedEmploymentStatus": "employment_status",
+    "formattedExperienceLevel": "experience_level",
+    "formattedIndustries": "industries",
+    "formattedJobFunctions": "job_functions",
+    "workplaceTypes": "workplace_types",
+    "workRemoteAllowed": "remote_allowed",
+    "jobState": "job_state",
+}
+
+
+def _urn_id(urn):
+    """urn:li:fsd_jobPosting:123 -> 123, urn:li:fsd_jobPostingCard:(123,SEARCH) -> 123"""
+    tail = urn.split(":", 3)[-1]
+    return tail.strip("()").split(",")[0]
+
+
+def _text(value):
+    if isinstance(value, dict):
+        return value.get("text")
+    return value if isinstance(value, str) else None
+
+
+def _walk(value):
+    """Yield every nested value of a JSON structure"""
+    yield value
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _walk(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _walk(item)
+
+
+def _refs(value, prefixes):
+    return [v for v in _walk(value) if isinstance(v, str) and v.startswith(prefixes)]
+
+
+def _entities(responses):
+    entities = {}
+    for response in responses:
+        body = response.get("body") if "body" in response else response
+        if not isinstance(body, dict):
+            continue
+        for entity in body.get("included") or []:
+            if isinstance(entity, dict) and entity.get("entityUrn"):
+                urn = entity["entityUrn"]
+                entities[urn] = {**entities.get(urn, {}), **entity}
+    return entities
+
+
+def _job_id(entity):
+    if entity.get("jobPostingId"):
+        return str(entity["jobPostingId"])
+    urn = entity["entityUrn"]
+    if any(marker in urn for marker in JOB_URN_MARKERS) and "Card" not in urn:
+        return _urn_id(urn)
+    return None
+
+
+def _company_record(entity):
+    url = entity.get("url")
+    if not url and entity.get("universalName"):
+        url = f"https://www.linkedin.com/company/{entity['universalName']}/"
+    return {"company_name": _text(entity.get("name")), "company_url": url}
+
+
+def _profile_record(entity):
+    parts = (_text(entity.get("firstName")), _text(entity.get("lastName")))
+    name = " ".join(part for part in parts if part)
+    url = (
+        f"https://www.linkedin.com/in/{entity['publicIdentifier']}"
+        if entity.get("publicIdentifier")
+        else None
+    )
+    return {"hiring_manager_name": name or None, "hiring_manager_linkedin_url": url}
+
+
+def _job_record(entity, entities):
+    record = {
+        "title": _text(entity.get("title")),
+        "job_details": _text(entity.get("description")),
+        "company_location": entity.get("formattedLocation")
+        or _text(entity.get("location")),
+    }
+
+    listed_at = entity.get("listedAt") or entity.get("originalListedAt")
+    applies = entity.get("applies")
+    extra = {
+        name: entity[key] for key, name in EXTRA_JOB_FIELDS.items() if entity.get(key)
+    }
+    if isinstance(listed_at, (int, float)):
+        extra["listed_at"] = datetime.fromtimestamp(
+            listed_at / 1000, tz=timezone.utc
+        ).isoformat()
+    if isinstance(applies, int):
+        record["applicants"] = f"{applies} applicants"
+    record["extra"] = extra
+
+    # Company may be inlined (companyResolutionResult) or referenced by urn
+    for value in _walk(entity.get("companyDetails") or {}):
+        if isinstance(value, dict) and value.get("name") and value.get("url"):
+            record.update(_company_record(value))
+            break
+    if not record.get("company_url"):
+        for urn in _refs(entity, COMPANY_URN_PREFIXES):
+            if urn in entities:
+                record.update(_company_record(entities[urn]))
+                break
+    return record
+
+
+def merge_job_record(target, record):
+    """Merge a mapped job record into target, keeping existing values for missing fields"""
+    for key, value in record.items():
+        if key == "extra":
+            target.setdefault("extra", {}).update(value)
+        elif value not in (None, ""):
+            target[key] = value
+
+
+def map_voyager_responses(responses):
+    """Map captured LinkedIn API responses to per-job records keyed by job id.
+
+    Works on the normalized JSON ("included" entities) returned by LinkedIn's
+    internal API. Fields that cannot be found are left out so the DOM extractors
+    can fill them in.
+    """
+    entities = _entities(responses)
+    records = {}
+
+    for entity in entities.values():
+        job_id = _job_id(entity)
+        if job_id and (entity.get("title") or entity.get("description")):
+            record = _job_record(entity, entities)
+            merge_job_record(records.setdefault(job_id, {}), record)
+
+    # Hiring team entities reference both the job posting and the hirer's profile
+    for entity in entities.values():
+        entity_type = entity.get("$type", "")
+        if "HiringTeam" not in entity_type and "Hirer" not in entity_type:
+            continue
+        job_ids = {
+            job_id
+            for v in _walk(entity)
+            if isinstance(v, str)
+            for job_id in JOB_ID_IN_URN.findall(v)
+        }
+        profiles = [
+            entities[urn] for urn in _refs(entity, PROFILE_URN_PREFIXES) if urn in entities
+        ]
+        if not profiles:
+            continue
+        for job_id in job_ids:
+            record = _profile_record(profiles[0])
+            merge_job_record(records.setdefault(job_id, {}), record)
+
+    return records
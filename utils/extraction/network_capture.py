@@ -0,0 +1,72 @@
+import json
+import os
+import time
+
+# LinkedIn's internal API; only job-related calls are worth fetching bodies for
+VOYAGER_API = "/voyager/api/"
+RELEVANT_KEYWORDS = ("job", "graphql", "organization", "compan")
+
+
+def _is_relevant(url, mime_type):
+    if VOYAGER_API not in url or "json" not in (mime_type or ""):
+        return False
+    lowered = url.lower()
+    return any(keyword in lowered for keyword in RELEVANT_KEYWORDS)
+
+
+def drain_network_responses(driver):
+    """Read the performance log and return the bodies of relevant JSON API responses.
+
+    Requires a driver created with capture_network=True. Reading the log drains
+    it, so each call only sees responses received since the previous call.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        print(f"Could not read performance log: {e}")
+        return []
+
+    pending = {}
+    finished = set()
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        params = message.get("params", {})
+        if message.get("method") == "Network.responseReceived":
+            response = params.get("response", {})
+            if _is_relevant(response.get("url", ""), response.get("mimeType")):
+                pending[params["requestId"]] = response["url"]
+        elif message.get("method") == "Network.loadingFinished":
+            finished.add(params.get("requestId"))
+
+    responses = []
+    for request_id, url in pending.items():
+        if request_id not in finished:
+            continue
+        try:
+            body = driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+            responses.append({"url": url, "body": json.loads(body["body"])})
+        except Exception:
+            # Body already evicted from Chrome's buffer or not JSON
+            continue
+    return responses
+
+
+def save_responses(responses, directory):
+    """Record captured responses so they can be replayed with load_responses"""
+    if not responses:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{int(time.time() * 1000)}.json")
+    with open(path, "w") as f:
+        json.dump(responses, f)
+    return path
+
+
+def load_responses(path):
+    with open(path, "r") as f:
+        return json.load(f)
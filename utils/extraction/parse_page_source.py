@@ -0,0 +1,92 @@
+import json
+
+from lxml import html as lxml_html
+
+from .extract_company_details import ABOUT_SECTION_SELECTORS, WEBSITE_SELECTORS
+from .extract_name import extract_name
+from .split_role_metadata import split_role_metadata
+
+
+def _has_class(class_name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _text(element):
+    """Approximate innerText: collapse whitespace within lines, keep line breaks"""
+    lines = [" ".join(line.split()) for line in element.text_content().splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _first(tree, xpaths):
+    for xpath in xpaths:
+        matches = tree.xpath(xpath)
+        if matches:
+            return matches[0]
+    return None
+
+
+def parse_job_page(page_source):
+    """Extract job fields from an archived job detail page, offline"""
+    tree = lxml_html.fromstring(page_source)
+
+    title_el = _first(
+        tree, [f"//*[{_has_class('job-details-jobs-unified-top-card__job-title')}]"]
+    )
+
+    company_link = _first(
+        tree, ["//a[starts-with(@href, 'https://www.linkedin.com/company/')]"]
+    )
+
+    metadata_el = _first(
+        tree,
+        [
+            f"(//*[{_has_class('job-details-jobs-unified-top-card__primary-description-container')}]//div)[1]"
+        ],
+    )
+    if metadata_el is not None:
+        company_location, posted_at, applicants = split_role_metadata(
+            " ".join(metadata_el.text_content().split())
+        )
+    else:
+        company_location, posted_at, applicants = None, None, None
+
+    hiring_manager = _first(
+        tree, [f"//*[{_has_class('hirer-card__hirer-information')}]//a"]
+    )
+
+    job_details_el = _first(tree, ["//*[@id='job-details']"])
+
+    return {
+        "title": _text(title_el) if title_el is not None else None,
+        "company_name": _text(company_link) if company_link is not None else None,
+        "company_url": company_link.get("href") if company_link is not None else None,
+        "company_location": company_location,
+        "role_metadata": {"posted_at": posted_at, "applicants": applicants},
+        "hiring_manager_name": extract_name(hiring_manager.get("aria-label") or "")
+        if hiring_manager is not None
+        else None,
+        "hiring_manager_linkedin_url": hiring_manager.get("href")
+        if hiring_manager is not None
+        else None,
+        "job_details": _text(job_details_el) if job_details_el is not None else "",
+    }
+
+
+def parse_company_page(page_source):
+    """Extract company domain and about details from an archived company page"""
+    tree = lxml_html.fromstring(page_source)
+
+    website = _first(tree, [selector for _, selector in WEBSITE_SELECTORS])
+    section = _first(tree, [selector for _, selector in ABOUT_SECTION_SELECTORS])
+
+    company_details = {}
+    if section is not None:
+        for dt in section.xpath(".//dt"):
+            dd = dt.xpath("./following-sibling::dd[1]")
+            if dd:
+                company_details[_text(dt)] = _text(dd[0])
+
+    return {
+        "company_domain": website.get("href") if website is not None else None,
+        "company_details": json.dumps(company_details, indent=4),
+    }
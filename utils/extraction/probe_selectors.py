@@ -0,0 +1,57 @@
+import time
+
+
+def _find_first(driver, candidates):
+    """Return the first element matched by any of the fallback selectors"""
+    for by, selector in candidates:
+        try:
+            elements = driver.find_elements(by, selector)
+        except Exception:
+            continue
+        if elements:
+            return elements[0]
+    return None
+
+
+def probe_selectors(driver, selectors, timeout, settle=2.0, poll=0.25):
+    """Check several selector groups at once and fail fast on missing ones.
+
+    `selectors` maps a name to a list of (By, selector) fallbacks. Polling stops
+    as soon as every group is found, or when `timeout` runs out. Once at least
+    one group has rendered and the document has finished loading, the remaining
+    groups get `settle` more seconds; sections render client-side after load,
+    so the settle timer never starts while nothing has been found.
+    Returns a dict of name -> element (None for groups that were not found).
+    """
+    found = {name: None for name in selectors}
+    deadline = time.monotonic() + max(0.0, timeout)
+    last_change = None
+
+    while True:
+        for name, candidates in selectors.items():
+            if found[name] is None:
+                element = _find_first(driver, candidates)
+                if element is not None:
+                    found[name] = element
+                    last_change = time.monotonic()
+
+        if all(element is not None for element in found.values()):
+            break
+
+        now = time.monotonic()
+        if now >= deadline:
+            break
+
+        try:
+            ready = driver.execute_script("return document.readyState") == "complete"
+        except Exception:
+            ready = False
+        if ready and last_change is not None and now - last_change >= settle:
+            break
+
+        time.sleep(min(poll, max(0.0, deadline - now)))
+
+    missing = [name for name, element in found.items() if element is None]
+    if missing:
+        print(f"Selectors not found: {', '.join(missing)}")
+    return found
@@ -1,18 +1,61 @@
 from supabase import Client, create_client
 import json
-import time
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from .safe_find_element import safe_find_element
 from .extract_name import extract_name
-from .extract_company_details import extract_company_details
+from .split_role_metadata import split_role_metadata
+from .extract_company_details import (
+    extract_company_details,
+    ABOUT_SECTION_SELECTORS,
+    WEBSITE_SELECTORS,
+)
+from .probe_selectors import probe_selectors
+from .time_budget import TimeBudget
+from ..missing_sections_cache import MissingSectionsCache
+from ..company_index import CompanyIndex, find_company
+from ..normalize_company import canonical_linkedin_company_url, normalize_domain
 from ..insert_data import insert_data
+from ..insert_duplicate_job import insert_duplicate_job
 
 
-async def process_job_data(driver, job_id, supabase: Client):
-    """Process job data from LinkedIn job posting"""
+def load_page_within(driver, url, timeout):
+    """Navigate to url, giving up on the page load after timeout seconds"""
+    original_timeout = driver.timeouts.page_load
+    driver.set_page_load_timeout(max(timeout, 0.5))
+    try:
+        driver.get(url)
+    except TimeoutException:
+        # Keep whatever has rendered so far; the probe decides what is usable
+        print(f"Page load exceeded {timeout:.1f}s budget: {url}")
+    finally:
+        driver.set_page_load_timeout(original_timeout)
+
+
+async def process_job_data(
+    driver,
+    job_id,
+    supabase: Client,
+    budget=None,
+    missing_sections=None,
+    archive=None,
+    company_index=None,
+    captured=None,
+    dedup_index=None,
+):
+    """Process job data from LinkedIn job posting.
+
+    `captured` holds fields already mapped from LinkedIn's API responses (see
+    map_voyager_responses); DOM extraction only runs for fields it lacks.
+    With a `dedup_index`, near-duplicates of an already stored posting are saved
+    with a `canonical_job_id` link to it and skip company enrichment, the
+    recruiter upsert and Apollo.
+    """
+    budget = budget or TimeBudget()
+    missing_sections = missing_sections or MissingSectionsCache()
+    company_index = company_index or CompanyIndex()
+    captured = captured or {}
+
     # Check if job already exists
     job_response = (
         supabase.table("linkedin_jobs").select("id").eq("id", int(job_id)).execute()
@@ -22,33 +65,36 @@ async def process_job_data(driver, job_id, supabase: Client):
         print(f"Job {job_id} already exists in database, skipping...")
         return None, None, None
 
+    if archive:
+        archive.save("job", job_id, driver.page_source)
+
     # Extract job title
-    title_el = safe_find_element(
-        driver, By.CLASS_NAME, "job-details-jobs-unified-top-card__job-title"
-    )
-    title = title_el.text if title_el else None
+    title = captured.get("title")
+    if not title:
+        title_el = safe_find_element(
+            driver, By.CLASS_NAME, "job-details-jobs-unified-top-card__job-title"
+        )
+        title = title_el.text if title_el else None
 
     # Extract company information
-    try:
-        company_link = driver.find_element(
-            By.XPATH, "//a[starts-with(@href, 'https://www.linkedin.com/company/')]"
-        )
-        company_name = company_link.text
-        company_url = company_link.get_attribute("href")
-    except NoSuchElementException:
-        print("Could not find company link")
-        return None, None, None
+    company_name = captured.get("company_name")
+    company_url = captured.get("company_url")
+    if not (company_name and company_url):
+        try:
+            company_link = driver.find_element(
+                By.XPATH, "//a[starts-with(@href, 'https://www.linkedin.com/company/')]"
+            )
+            company_name = company_link.text
+            company_url = company_link.get_attribute("href")
+        except NoSuchElementException:
+            print("Could not find company link")
+            return None, None, None
 
-    # Check if company exists in database
-    company_response = (
-        supabase.table("companies")
-        .select("id, company_domain, metadata")
-        .eq("linkedin_url", company_url.replace("/life", ""))
-        .execute()
-    )
-    company_exists = len(company_response.data) > 0
-    company_domain = None
-    company_details = json.dumps({})
+    # Extract job details
+    job_details = captured.get("job_details")
+    if not job_details:
+        job_details_element = safe_find_element(driver, By.ID, "job-details")
+        job_details = job_details_element.text if job_details_element else ""
 
     # Extract role metadata
     try:
@@ -58,70 +104,115 @@ async def process_job_data(driver, job_id, supabase: Client):
                     .getElementsByTagName('div')[0].innerText;
         """
         )
-        metadata_parts = role_metadata.split("·")
-        company_location = (
-            metadata_parts[0].strip() if len(metadata_parts) > 0 else None
-        )
-        posted_at = metadata_parts[1].strip() if len(metadata_parts) > 1 else None
-        applicants = metadata_parts[2].strip() if len(metadata_parts) > 2 else None
+        company_location, posted_at, applicants = split_role_metadata(role_metadata)
     except:
         print("Could not find company location")
         company_location = None
         posted_at = None
         applicants = None
+    company_location = captured.get("company_location") or company_location
+    applicants = captured.get("applicants") or applicants
+
+    # Set role metadata
+    role_meta = {"posted_at": posted_at, "applicants": applicants}
+    role_meta.update(captured.get("extra", {}))
+
+    # Skip the expensive stages for reposts of a job we already have
+    if dedup_index:
+        canonical_job_id = dedup_index.find_duplicate(
+            job_id, title, company_name, job_details
+        )
+        if canonical_job_id and await insert_duplicate_job(
+            supabase, job_id, canonical_job_id, title, job_details, role_meta
+        ):
+            dedup_index.add(
+                job_id, title, company_name, job_details, canonical_id=canonical_job_id
+            )
+            print(f"Job {job_id} is a near-duplicate of job {canonical_job_id}, skipping...")
+            return None, None, None
+
+    # Check if company exists in database
+    company_row = find_company(
+        supabase,
+        company_index,
+        linkedin_url=company_url,
+        columns="id, company_domain, metadata",
+    )
+    company_exists = company_row is not None
+    company_domain = None
+    company_details = json.dumps({})
 
     # Get company domain if company doesn't exist
     if not company_exists:
-        company_url = company_url.replace("life", "about")
-        driver.execute_script("window.open('');")
-        driver.switch_to.window(driver.window_handles[1])
-        driver.get(company_url)
-        time.sleep(1)
+        company_key = canonical_linkedin_company_url(company_url)
+        sections = {}
+        if not missing_sections.is_missing(company_key, "website"):
+            sections["website"] = WEBSITE_SELECTORS
+        if not missing_sections.is_missing(company_key, "about"):
+            sections["about"] = ABOUT_SECTION_SELECTORS
 
-        try:
-            domain_element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//a[@target='_blank' and contains(@class, 'link-without-visited-state')]",
-                    )
-                )
+        if not sections:
+            print(
+                f"Company page for {company_key} has no website or about section, skipping"
             )
-            company_domain = domain_element.get_attribute("href")
-            if company_domain:
-                domain_response = (
-                    supabase.table("companies")
-                    .select("id, metadata")
-                    .eq("company_domain", company_domain)
-                    .execute()
-                )
-                if len(domain_response.data) > 0:
-                    company_details = domain_response.data[0]["metadata"]
-                    company_exists = True
-                else:
-                    company_details = extract_company_details(driver)
-            else:
-                company_details = extract_company_details(driver)
-        except (NoSuchElementException, TimeoutException) as e:
-            print(f"Error finding element or waiting: {e}")
-            company_domain = None
-            company_details = json.dumps({})
-        finally:
-            driver.close()
-            driver.switch_to.window(driver.window_handles[0])
-    else:
-        if company_response.data[0]["company_domain"]:
-            company_domain = company_response.data[0]["company_domain"]
-        if company_response.data[0]["metadata"]:
-            company_details = company_response.data[0]["metadata"]
+        else:
+            about_url = f"{company_key.rstrip('/')}/about/"
+            driver.execute_script("window.open('');")
+            driver.switch_to.window(driver.window_handles[1])
+            try:
+                load_page_within(driver, about_url, budget.stage("company_page_load"))
+                found = probe_selectors(driver, sections, budget.stage("company_probe"))
+                if archive:
+                    archive.save("company", company_key, driver.page_source)
 
-    # Set role metadata
-    role_meta = {"posted_at": posted_at, "applicants": applicants}
+                # A section is only known to be missing if the page rendered another one
+                if "website" in sections and found["website"] is None:
+                    if found.get("about") is not None:
+                        missing_sections.mark_missing(company_key, "website")
+                if "about" in sections and found["about"] is None:
+                    if found.get("website") is not None:
+                        missing_sections.mark_missing(company_key, "about")
+
+                if found.get("website") is not None:
+                    company_domain = normalize_domain(
+                        found["website"].get_attribute("href")
+                    )
+                if company_domain:
+                    domain_row = find_company(
+                        supabase,
+                        company_index,
+                        linkedin_url=company_url,
+                        company_domain=company_domain,
+                        columns="id, metadata",
+                    )
+                    if domain_row:
+                        company_details = domain_row["metadata"]
+                        company_exists = True
+                if not company_exists and found.get("about") is not None:
+                    company_details = extract_company_details(
+                        driver, section=found["about"]
+                    )
+            except (NoSuchElementException, TimeoutException) as e:
+                print(f"Error finding element or waiting: {e}")
+                company_domain = None
+                company_details = json.dumps({})
+            finally:
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+    else:
+        if company_row["company_domain"]:
+            company_domain = normalize_domain(company_row["company_domain"])
+        if company_row["metadata"]:
+            company_details = company_row["metadata"]
 
     # Extract hiring manager information
-    hiring_manager_element = safe_find_element(
-        driver, By.CLASS_NAME, "hirer-card__hirer-information"
-    )
+    hiring_manager_name = captured.get("hiring_manager_name")
+    hiring_manager_linkedin_url = captured.get("hiring_manager_linkedin_url")
+    hiring_manager_element = None
+    if not (hiring_manager_name and hiring_manager_linkedin_url):
+        hiring_manager_element = safe_find_element(
+            driver, By.CLASS_NAME, "hirer-card__hirer-information"
+        )
     if hiring_manager_element:
         try:
             hiring_manager = hiring_manager_element.find_element(By.TAG_NAME, "a")
@@ -132,16 +223,9 @@ async def process_job_data(driver, job_id, supabase: Client):
         except NoSuchElementException:
             hiring_manager_name = None
             hiring_manager_linkedin_url = None
-    else:
-        hiring_manager_name = None
-        hiring_manager_linkedin_url = None
-
-    # Extract job details
-    job_details_element = safe_find_element(driver, By.ID, "job-details")
-    job_details = job_details_element.text if job_details_element else ""
 
     # Insert data into Supabase
-    await insert_data(
+    inserted = await insert_data(
         supabase,
         company_name,
         company_location,
@@ -154,6 +238,10 @@ async def process_job_data(driver, job_id, supabase: Client):
         job_id,
         company_domain,
         company_details,
+        company_index=company_index,
     )
+    # Only stored postings may become canonical
+    if inserted and dedup_index:
+        dedup_index.add(job_id, title, company_name, job_details)
 
     return hiring_manager_name, hiring_manager_linkedin_url, company_domain
@@ -1,3 +1,4 @@
+import os
 import time
 import traceback
 
@@ -5,86 +6,202 @@ from selenium.common.exceptions import StaleElementReferenceException
 
 from ..navigation.scroll_to_parent_ui import scroll_to_parent_ul
 from .process_job_data import process_job_data
+from .time_budget import TimeBudget, DEFAULT_JOB_BUDGET
+from ..missing_sections_cache import MissingSectionsCache
+from ..company_index import CompanyIndex
+from ..job_dedup_index import JobDedupIndex
 from ..navigation.interact_with_apollo import interact_with_apollo
-
-
-async def scrape_and_process_jobs(driver, start_url, max_items=100, supabase=None):
-    """Scrape and process jobs from LinkedIn search results"""
+from ..check_captcha import is_challenged
+from .network_capture import drain_network_responses, save_responses
+from .map_voyager_responses import map_voyager_responses, merge_job_record
+
+# LinkedIn shows 25 job listings per search results page
+PAGE_SIZE = 25
+
+
+def collect_captured_jobs(driver, captured_jobs):
+    """Drain captured API responses and merge the mapped job records"""
+    responses = drain_network_responses(driver)
+    if os.getenv("NETWORK_CAPTURE_DIR"):
+        save_responses(responses, os.getenv("NETWORK_CAPTURE_DIR"))
+    for job_id, record in map_voyager_responses(responses).items():
+        merge_job_record(captured_jobs.setdefault(job_id, {}), record)
+
+
+async def process_search_page(driver, url, supabase, on_job_view=None, **process_kwargs):
+    """Process every job listing on one search results page.
+
+    Returns (number of listings found, per-job results), or (None, []) if
+    LinkedIn answered with a security challenge instead of results.
+    """
+    results = []
+    driver.get(url)
+    time.sleep(2)
+    if is_challenged(driver):
+        print(f"Security challenge while loading {url}")
+        return None, results
+    captured_jobs = {}
+    network_capture = process_kwargs.pop("network_capture", False)
+    job_budget = process_kwargs.pop("job_budget", None)
+
+    # Find job listings
+    list_items = scroll_to_parent_ul(driver, "job-card-container")
+    if not list_items or len(list_items) == 0:
+        print("No job listings found on page")
+        return 0, results
+
+    print(f"Found {len(list_items)} job listings on current page")
+
+    # Process each job listing
+    for index, item in enumerate(list_items):
+        for attempt in range(3):
+            try:
+                # Click on job listing to view details
+                item.click()
+                time.sleep(2)
+                if on_job_view:
+                    on_job_view()
+
+                # Extract job ID
+                job_id = item.get_attribute("data-job-id")
+                print(f"Processing job ID: {job_id}")
+
+                # Collect what LinkedIn's own API returned for the list and this job
+                if network_capture:
+                    collect_captured_jobs(driver, captured_jobs)
+
+                # Process job data
+                (
+                    hiring_manager_name,
+                    hiring_manager_linkedin_url,
+                    company_domain,
+                ) = await process_job_data(
+                    driver,
+                    job_id,
+                    supabase,
+                    budget=TimeBudget(job_budget or DEFAULT_JOB_BUDGET),
+                    captured=captured_jobs.get(str(job_id)),
+                    **process_kwargs,
+                )
+
+                results.append(
+                    {
+                        "job_id": job_id,
+                        "hiring_manager_name": hiring_manager_name,
+                        "hiring_manager_linkedin_url": hiring_manager_linkedin_url,
+                        "company_domain": company_domain,
+                    }
+                )
+
+                # Interact with Apollo if hiring manager info is available
+                if hiring_manager_name and hiring_manager_linkedin_url:
+                    print(
+                        f"Found hiring manager: {hiring_manager_name}, attempting to add to Apollo sequence"
+                    )
+                    success = interact_with_apollo(driver, hiring_manager_linkedin_url)
+                    if success:
+                        print(
+                            f"Successfully added {hiring_manager_name} to Apollo sequence"
+                        )
+                    else:
+                        print(f"Failed to add {hiring_manager_name} to Apollo sequence")
+
+                break  # Break out of retry loop if successful
+
+            except StaleElementReferenceException:
+                if attempt == 2:  # Last attempt
+                    print(f"Failed to process job after 3 attempts")
+                else:
+                    print(
+                        f"StaleElementReferenceException occurred, retrying (attempt {attempt + 1})"
+                    )
+                    time.sleep(1)
+            except Exception as e:
+                print(f"Error processing job listing: {str(e)}")
+                break
+
+    return len(list_items), results
+
+
+async def scrape_and_process_jobs(
+    driver,
+    start_url,
+    max_items=100,
+    supabase=None,
+    job_budget=None,
+    archive=None,
+    network_capture=False,
+    rotator=None,
+    missing_sections=None,
+    company_index=None,
+):
+    """Scrape and process jobs from LinkedIn search results.
+
+    With a `rotator`, each results page is run on whichever account has the
+    most quota left and `driver` is ignored. Concurrent callers should pass
+    shared `missing_sections` and `company_index` instances so their updates
+    are not overwritten by each other. Returns the hiring manager and company
+    domain found for every job visited.
+    """
     item_count = 0
+    results = []
+    dedup_index = JobDedupIndex()
+    process_kwargs = {
+        "job_budget": job_budget,
+        "network_capture": network_capture,
+        "missing_sections": missing_sections or MissingSectionsCache(),
+        "archive": archive,
+        "company_index": company_index or CompanyIndex(),
+        "dedup_index": dedup_index,
+    }
 
     try:
         while item_count < max_items:
             url = f"{start_url}&start={item_count}"
-            driver.get(url)
-            time.sleep(2)
 
             try:
-                # Find job listings
-                list_items = scroll_to_parent_ul(driver, "job-card-container")
-                if not list_items or len(list_items) == 0:
-                    print("No job listings found on page")
-                    break
-
-                print(f"Found {len(list_items)} job listings on current page")
-
-                # Process each job listing
-                for index, item in enumerate(list_items):
-                    for attempt in range(3):
-                        try:
-                            # Click on job listing to view details
-                            item.click()
-                            time.sleep(2)
-
-                            # Extract job ID
-                            job_id = item.get_attribute("data-job-id")
-                            print(f"Processing job ID: {job_id}")
-
-                            # Process job data
-                            (
-                                hiring_manager_name,
-                                hiring_manager_linkedin_url,
-                                company_domain,
-                            ) = await process_job_data(driver, job_id, supabase)
-
-                            # Interact with Apollo if hiring manager info is available
-                            if hiring_manager_name and hiring_manager_linkedin_url:
-                                print(
-                                    f"Found hiring manager: {hiring_manager_name}, attempting to add to Apollo sequence"
-                                )
-                                success = interact_with_apollo(
-                                    driver, hiring_manager_linkedin_url
-                                )
-                                if success:
-                                    print(
-                                        f"Successfully added {hiring_manager_name} to Apollo sequence"
-                                    )
-                                else:
-                                    print(
-                                        f"Failed to add {hiring_manager_name} to Apollo sequence"
-                                    )
-
-                            break  # Break out of retry loop if successful
-
-                        except StaleElementReferenceException:
-                            if attempt == 2:  # Last attempt
-                                print(f"Failed to process job after 3 attempts")
-                            else:
-                                print(
-                                    f"StaleElementReferenceException occurred, retrying (attempt {attempt + 1})"
-                                )
-                                time.sleep(1)
-                        except Exception as e:
-                            print(f"Error processing job listing: {str(e)}")
+                if rotator:
+                    with rotator.session(
+                        "search_pages", job_views=PAGE_SIZE
+                    ) as session:
+                        if session is None:
+                            print("All LinkedIn accounts are out of quota or retired, stopping")
                             break
+                        account, driver = session
+                        print(f"Using account {account.username} for {url}")
+                        rotator.pool.record(account, "search_pages")
+                        found, page_results = await process_search_page(
+                            driver,
+                            url,
+                            supabase,
+                            on_job_view=lambda: rotator.pool.record(account, "job_views"),
+                            **process_kwargs,
+                        )
+                    if found is None:
+                        continue  # Account was retired; retry the page with another one
+                else:
+                    found, page_results = await process_search_page(
+                        driver, url, supabase, **process_kwargs
+                    )
+                    if found is None:
+                        break
+
+                results.extend(page_results)
+                if found == 0:
+                    break
 
                 # Move to next page of results
-                print(f"Processed {len(list_items)} job listings, moving to next page")
-                item_count += 25
+                print(f"Processed {found} job listings, moving to next page")
+                item_count += PAGE_SIZE
 
             except Exception as page_error:
                 print(f"Error processing page: {str(page_error)}")
-                item_count += 25  # Move to next page despite error
+                item_count += PAGE_SIZE  # Move to next page despite error
 
     except Exception as e:
         print(f"Error in scrape_and_process_jobs: {str(e)}")
         traceback.print_exc()
+    finally:
+        dedup_index.close()
+
+    return results
@@ -0,0 +1,7 @@
+def split_role_metadata(role_metadata):
+    """Split the "location · posted · applicants" line of a job posting"""
+    metadata_parts = role_metadata.split("·")
+    company_location = metadata_parts[0].strip() if len(metadata_parts) > 0 else None
+    posted_at = metadata_parts[1].strip() if len(metadata_parts) > 1 else None
+    applicants = metadata_parts[2].strip() if len(metadata_parts) > 2 else None
+    return company_location, posted_at, applicants
@@ -0,0 +1,30 @@
+import time
+
+# Total seconds a single job may spend loading and probing its company page
+DEFAULT_JOB_BUDGET = 12
+
+# Upper bound per stage; a stage never gets more than what is left of the job budget
+STAGE_CAPS = {
+    "company_page_load": 3,
+    "company_probe": 6,
+}
+
+
+class TimeBudget:
+    """Wall-clock budget for one job's company page waits, split across named stages"""
+
+    def __init__(self, total=DEFAULT_JOB_BUDGET, stage_caps=None):
+        self.total = total
+        self.stage_caps = stage_caps or STAGE_CAPS
+        self.started_at = time.monotonic()
+
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+    def remaining(self):
+        return max(0.0, self.total - self.elapsed())
+
+    def stage(self, name):
+        """Return the timeout available to a stage right now"""
+        cap = self.stage_caps.get(name, self.total)
+        return min(cap, self.remaining())
@@ -1,5 +1,12 @@
 from supabase import Client, create_client
 
+from .company_index import find_company
+from .normalize_company import (
+    canonical_linkedin_company_url,
+    linkedin_company_slug,
+    normalize_domain,
+)
+
 
 async def insert_data(
     supabase: Client,
@@ -14,26 +21,19 @@ async def insert_data(
     job_id,
     company_domain,
     company_details,
+    company_index=None,
 ):
     """Insert job and company data into Supabase"""
     try:
-        company_url = company_url.replace("/about", "").replace("/life", "")
-        company_response = (
-            supabase.table("companies")
-            .select("id")
-            .eq("linkedin_url", company_url)
-            .execute()
+        company_url = canonical_linkedin_company_url(company_url)
+        company_domain = normalize_domain(company_domain)
+        company_row = find_company(
+            supabase,
+            company_index,
+            linkedin_url=company_url,
+            company_domain=company_domain,
         )
-        company_id = company_response.data[0]["id"] if company_response.data else None
-
-        if not company_id and company_domain:
-            domain_response = (
-                supabase.table("companies")
-                .select("id")
-                .eq("company_domain", company_domain)
-                .execute()
-            )
-            company_id = domain_response.data[0]["id"] if domain_response.data else None
+        company_id = company_row["id"] if company_row else None
 
         if not company_id:
             company_response = (
@@ -50,6 +50,12 @@ async def insert_data(
                 .execute()
             )
             company_id = company_response.data[0]["id"]
+            if company_index:
+                company_index.add(
+                    company_id,
+                    slug=linkedin_company_slug(company_url),
+                    domain=company_domain,
+                )
         else:
             update_data = {}
             if company_domain:
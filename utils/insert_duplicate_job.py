@@ -0,0 +1,40 @@
+from supabase import Client
+
+
+async def insert_duplicate_job(
+    supabase: Client, job_id, canonical_job_id, title, job_details, role_meta
+):
+    """Store a near-duplicate posting linked to its canonical job.
+
+    The company and recruiter are copied from the canonical job, so no
+    enrichment or recruiter upsert is needed. Returns False if the canonical
+    job is not in the database or the insert fails.
+    """
+    try:
+        canonical_response = (
+            supabase.table("linkedin_jobs")
+            .select("company_id, recruiter_id")
+            .eq("id", int(canonical_job_id))
+            .execute()
+        )
+        if not canonical_response.data:
+            print(f"Canonical job {canonical_job_id} not found in database")
+            return False
+        canonical = canonical_response.data[0]
+
+        job_data = {
+            "id": int(job_id),
+            "company_id": canonical["company_id"],
+            "title": title,
+            "description": job_details,
+            "role_metadata": role_meta,
+            "canonical_job_id": int(canonical_job_id),
+        }
+        if canonical.get("recruiter_id"):
+            job_data["recruiter_id"] = canonical["recruiter_id"]
+
+        supabase.table("linkedin_jobs").insert(job_data).execute()
+        return True
+    except Exception as e:
+        print(f"Error inserting duplicate job: {str(e)}")
+        return False
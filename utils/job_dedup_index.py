@@ -0,0 +1,177 @@
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import struct
+
+DEFAULT_DEDUP_PATH = os.path.join(".cache", "job_dedup.sqlite3")
+
+NUM_PERMUTATIONS = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 5
+# Estimated Jaccard similarity above which a posting counts as a duplicate
+SIMILARITY_THRESHOLD = 0.8
+# Postings with fewer description shingles than this are never flagged
+MIN_SHINGLES = 20
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def normalize_text(text):
+    return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).strip()
+
+
+def _hash(value):
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def shingles(title, company, details):
+    """Word 5-grams of the description, plus the normalized title and company"""
+    words = normalize_text(details).split()
+    result = {
+        " ".join(words[i : i + SHINGLE_SIZE])
+        for i in range(max(0, len(words) - SHINGLE_SIZE + 1))
+    }
+    if normalize_text(title):
+        result.add(f"title:{normalize_text(title)}")
+    if normalize_text(company):
+        result.add(f"company:{normalize_text(company)}")
+    return result
+
+
+def minhash(shingle_set):
+    """MinHash signature, truncated to 32 bits per permutation to halve storage"""
+    hashes = [_hash(shingle) for shingle in shingle_set]
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def _band_keys(signature):
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f"<{ROWS_PER_BAND}I", *rows), digest_size=8)
+        yield band, int.from_bytes(digest.digest(), "little", signed=True)
+
+
+def _similarity(a, b):
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERMUTATIONS
+
+
+class JobDedupIndex:
+    """MinHash/LSH index over job postings that links near-duplicates to a canonical job.
+
+    Signatures and LSH buckets live in SQLite, so memory use stays flat as the
+    index grows; a lookup reads at most one row per band plus the candidates'
+    signatures.
+    """
+
+    def __init__(self, path=DEFAULT_DEDUP_PATH, threshold=SIMILARITY_THRESHOLD):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.threshold = threshold
+        self._last = None
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS signatures ("
+            "job_id TEXT PRIMARY KEY, signature BLOB NOT NULL, canonical_id TEXT NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "band INTEGER, bucket INTEGER, job_id TEXT NOT NULL, PRIMARY KEY (band, bucket))"
+        )
+        self.db.commit()
+
+    def canonical_of(self, job_id):
+        row = self.db.execute(
+            "SELECT canonical_id FROM signatures WHERE job_id = ?", (str(job_id),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _signature(self, job_id, title, company, details):
+        """MinHash signature and band keys of a posting, or None if it is too short"""
+        if self._last and self._last[0] == job_id:
+            return self._last[1]
+        shingle_set = shingles(title, company, details)
+        if len(shingle_set) < MIN_SHINGLES:
+            result = None
+        else:
+            signature = minhash(shingle_set)
+            result = signature, list(_band_keys(signature))
+        self._last = (job_id, result)
+        return result
+
+    def find_duplicate(self, job_id, title, company, details):
+        """Return the canonical job id if the posting is a near-duplicate of an indexed one.
+
+        The posting itself is not indexed; call `add` once it has been stored.
+        """
+        job_id = str(job_id)
+        known = self.canonical_of(job_id)
+        if known is not None:
+            return known if known != job_id else None
+
+        computed = self._signature(job_id, title, company, details)
+        if computed is None:
+            return None
+        signature, band_keys = computed
+
+        candidates = set()
+        for band, bucket in band_keys:
+            row = self.db.execute(
+                "SELECT job_id FROM buckets WHERE band = ? AND bucket = ?", (band, bucket)
+            ).fetchone()
+            if row:
+                candidates.add(row[0])
+
+        canonical_id, best = None, 0.0
+        for candidate in candidates:
+            row = self.db.execute(
+                "SELECT signature, canonical_id FROM signatures WHERE job_id = ?",
+                (candidate,),
+            ).fetchone()
+            if not row:
+                continue
+            similarity = _similarity(
+                signature, struct.unpack(f"<{NUM_PERMUTATIONS}I", row[0])
+            )
+            if similarity >= self.threshold and similarity > best:
+                canonical_id, best = row[1], similarity
+        return canonical_id
+
+    def add(self, job_id, title, company, details, canonical_id=None):
+        """Index a stored posting, linked to `canonical_id` if it is a duplicate"""
+        job_id = str(job_id)
+        computed = self._signature(job_id, title, company, details)
+        if computed is None:
+            return
+        signature, band_keys = computed
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO signatures VALUES (?, ?, ?)",
+                (
+                    job_id,
+                    struct.pack(f"<{NUM_PERMUTATIONS}I", *signature),
+                    str(canonical_id) if canonical_id else job_id,
+                ),
+            )
+            self.db.executemany(
+                "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?)",
+                [(band, bucket, job_id) for band, bucket in band_keys],
+            )
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,63 @@
+import json
+import os
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "missing_sections.json")
+# A page that once rendered without a section is re-checked after this long
+DEFAULT_TTL = 7 * 24 * 3600
+
+
+class MissingSectionsCache:
+    """Remember company pages known to lack a website link or about card.
+
+    Entries expire after `ttl` seconds, so a page that rendered incompletely
+    once is not skipped forever. One instance can be shared by concurrent jobs.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        except (ValueError, OSError) as e:
+            print(f"Could not read missing sections cache, starting empty: {e}")
+            data = {}
+        # Entries written before expiry was added are lists without a timestamp
+        self.entries = {
+            company_key: sections
+            if isinstance(sections, dict)
+            else {section: 0 for section in sections}
+            for company_key, sections in data.items()
+        }
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.path)
+
+    def is_missing(self, company_key, section):
+        marked_at = self.entries.get(company_key, {}).get(section)
+        return marked_at is not None and time.time() - marked_at < self.ttl
+
+    def mark_missing(self, company_key, section):
+        with self.lock:
+            if self.is_missing(company_key, section):
+                return
+            self.entries.setdefault(company_key, {})[section] = int(time.time())
+            try:
+                self._save()
+            except OSError as e:
+                print(f"Could not persist missing sections cache: {e}")
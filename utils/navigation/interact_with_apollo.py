@@ -1,8 +1,13 @@
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+import threading
 import time
 from .click_x_y import click_on_x_y
 
+# Apollo is driven with the one physical mouse at fixed screen coordinates, so
+# browsers running in parallel (service pool, account rotation) take turns
+APOLLO_LOCK = threading.Lock()
+
 
 def interact_with_apollo_icon(driver):
     try:
@@ -27,12 +32,22 @@ def interact_with_apollo_icon(driver):
 
 
 def interact_with_apollo(driver, linkedin_url):
+    with APOLLO_LOCK:
+        return _interact_with_apollo(driver, linkedin_url)
+
+
+def _interact_with_apollo(driver, linkedin_url):
     try:
         print("[INFO] Opening new tab...")
         driver.execute_script("window.open('');")
         driver.switch_to.window(driver.window_handles[1])
         driver.get(linkedin_url)
         time.sleep(3)
+        # Raise this browser above the others before clicking by coordinates
+        try:
+            driver.execute_cdp_cmd("Page.bringToFront", {})
+        except Exception as e:
+            print(f"[WARN] Could not bring browser to front: {e}")
         interact_with_apollo_icon(driver)
         add_to_sequence_success = click_on_x_y(700, 500, 2, True)
         sent_sequence_success = click_on_x_y(700, 550, 1)
@@ -3,8 +3,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import time
 
+from ..check_captcha import check_for_captcha
 
-def login_to_linkedin(driver, linkedin_username, linkedin_password):
+
+def login_to_linkedin(driver, linkedin_username, linkedin_password, interactive=True):
     """Login to LinkedIn account"""
     driver.get("https://www.linkedin.com/uas/login")
 
@@ -22,8 +24,9 @@ def login_to_linkedin(driver, linkedin_username, linkedin_password):
         driver.find_element(By.XPATH, "//button[@type='submit']").click()
         time.sleep(3)
 
-        # Check for CAPTCHA
-        check_for_captcha(driver)
+        # Check for CAPTCHA; unattended callers handle challenges themselves
+        if interactive:
+            check_for_captcha(driver)
     except Exception as e:
         print(f"Error during LinkedIn login: {e}")
         if "username" in str(e).lower():
@@ -0,0 +1,111 @@
+import ipaddress
+from urllib.parse import parse_qs, unquote, urlparse
+
+import tldextract
+
+# Public suffix list (including private entries such as github.io) from the
+# snapshot bundled with tldextract; never fetched over the network
+_extract = tldextract.TLDExtract(
+    suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True
+)
+
+# Hosting platforms that give every site its own subdomain (alpha.github.io)
+SHARED_HOST_SUFFIXES = {
+    "github.io", "gitlab.io", "wixsite.com", "notion.site", "webflow.io",
+    "herokuapp.com", "netlify.app", "vercel.app", "pages.dev", "carrd.co",
+    "wordpress.com", "blogspot.com", "squarespace.com", "weebly.com",
+    "godaddysites.com", "business.site", "myshopify.com", "substack.com",
+    "azurewebsites.net", "framer.website",
+}
+
+# Domains shared by unrelated companies: hosting platforms, URL shorteners,
+# link-in-bio pages and social profiles. They are never used to match companies,
+# and websites on them are stored with their full host.
+NON_COMPANY_DOMAINS = SHARED_HOST_SUFFIXES | {
+    "google.com", "sites.google.com", "linktr.ee", "bit.ly", "lnkd.in", "t.co",
+    "tinyurl.com", "goo.gl", "ow.ly", "buff.ly", "rebrand.ly", "beacons.ai",
+    "about.me", "notion.so", "github.com", "facebook.com", "instagram.com",
+    "twitter.com", "x.com", "linkedin.com", "youtube.com", "medium.com",
+    "angel.co", "wellfound.com", "crunchbase.com",
+}
+
+LINKEDIN_COMPANY_URL = "https://www.linkedin.com/company/{slug}/"
+
+
+def _parse(url):
+    url = url.strip()
+    if "://" not in url:
+        url = f"//{url}"
+    return urlparse(url)
+
+
+def normalize_domain(url):
+    """Reduce a website URL to its registrable domain, e.g. https://www.shop.acme.co.uk/x?utm=1 -> acme.co.uk.
+
+    Uses the public suffix list. Websites on shared hosts keep their full host
+    (sites.google.com, acme.notion.site); IP addresses and unknown suffixes give None.
+    """
+    if not url:
+        return None
+    try:
+        parsed = _parse(url)
+        host = (parsed.hostname or "").lower().rstrip(".")
+
+        # LinkedIn wraps outbound links in a redirect
+        if host.endswith("linkedin.com") and parsed.path.startswith("/redir"):
+            target = parse_qs(parsed.query).get("url")
+            return normalize_domain(unquote(target[0])) if target else None
+    except ValueError:
+        return None
+
+    try:
+        ipaddress.ip_address(host)
+        return None
+    except ValueError:
+        pass
+
+    extracted = _extract(host)
+    if not (extracted.domain and extracted.suffix):
+        return None
+    registrable = f"{extracted.domain}.{extracted.suffix}"
+    if domain_match_key(registrable) is None:
+        # e.g. sites.google.com: the parent domain says nothing about the company
+        return host[4:] if host.startswith("www.") else host
+    return registrable
+
+
+def domain_match_key(domain):
+    """Return the domain if it can identify a single company, else None.
+
+    Sites on shared hosts, shorteners and link-in-bio pages can belong to
+    anyone, e.g. alpha.github.io and beta.github.io.
+    """
+    if not domain:
+        return None
+    labels = domain.split(".")
+    for i in range(len(labels) - 1):
+        if ".".join(labels[i:]) in NON_COMPANY_DOMAINS:
+            return None
+    return domain
+
+
+def linkedin_company_slug(url):
+    """Return the lowercase slug of a LinkedIn company URL, e.g. .../company/Acme-Inc/life -> acme-inc"""
+    if not url:
+        return None
+    try:
+        parsed = _parse(url)
+    except ValueError:
+        return None
+    if not (parsed.hostname or "").lower().endswith("linkedin.com"):
+        return None
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) < 2 or parts[0].lower() != "company":
+        return None
+    return unquote(parts[1]).strip().lower() or None
+
+
+def canonical_linkedin_company_url(url):
+    """Return the canonical LinkedIn company URL, or the input if it has no slug"""
+    slug = linkedin_company_slug(url)
+    return LINKEDIN_COMPANY_URL.format(slug=slug) if slug else url
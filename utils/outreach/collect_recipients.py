@@ -0,0 +1,66 @@
+from supabase import Client
+
+PAGE_SIZE = 1000
+
+
+def collect_recipients(supabase: Client, sent_log, template, limit=None):
+    """Read recruiters with an email in bulk and attach their latest job and company.
+
+    Recruiters already in the sent log for this template are skipped, and an
+    email shared by several recruiter rows is only collected once.
+    """
+    recipients = []
+    seen = set()
+    start = 0
+    while limit is None or len(recipients) < limit:
+        recruiters = (
+            supabase.table("recruiters")
+            .select("id, name, email, company_domain")
+            .not_.is_("email", "null")
+            .order("id")
+            .range(start, start + PAGE_SIZE - 1)
+            .execute()
+        ).data
+        if not recruiters:
+            break
+
+        new_recruiters = {}
+        for recruiter in recruiters:
+            if not recruiter["email"] or not recruiter["email"].strip():
+                continue
+            key = sent_log.key(template, recruiter["email"])
+            if key in seen or sent_log.was_sent(template, recruiter["email"]):
+                continue
+            seen.add(key)
+            new_recruiters[recruiter["id"]] = recruiter
+        if new_recruiters:
+            jobs = (
+                supabase.table("linkedin_jobs")
+                .select("id, title, recruiter_id, companies(name)")
+                .in_("recruiter_id", list(new_recruiters))
+                .execute()
+            ).data
+            latest_jobs = {}
+            for job in jobs:
+                current = latest_jobs.get(job["recruiter_id"])
+                if current is None or job["id"] > current["id"]:
+                    latest_jobs[job["recruiter_id"]] = job
+
+            for recruiter_id, recruiter in new_recruiters.items():
+                job = latest_jobs.get(recruiter_id) or {}
+                company = job.get("companies") or {}
+                recipients.append(
+                    {
+                        "recruiter_id": recruiter_id,
+                        "name": recruiter["name"],
+                        "email": recruiter["email"].strip(),
+                        "job_title": job.get("title"),
+                        "company_name": company.get("name"),
+                    }
+                )
+
+        if len(recruiters) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+
+    return recipients[:limit] if limit is not None else recipients
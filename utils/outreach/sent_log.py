@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+import time
+
+DEFAULT_SENT_LOG_PATH = os.path.join(".cache", "outreach_sent.jsonl")
+
+
+class SentLog:
+    """Append-only, fsynced record of delivered messages, used to never email twice"""
+
+    def __init__(self, path=DEFAULT_SENT_LOG_PATH):
+        self.path = path
+        self.sent = set()
+        self.lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def key(template, email):
+        return f"{template}:{email.strip().lower()}"
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
+                    try:
+                        self.sent.add(json.loads(line)["key"])
+                    except (ValueError, KeyError):
+                        # A torn last line from a crash; the message is resent at worst once
+                        continue
+        except FileNotFoundError:
+            pass
+
+    def was_sent(self, template, email):
+        return self.key(template, email) in self.sent
+
+    def record(self, template, entries):
+        """Persist a batch of (email, message_id, recruiter_id) tuples"""
+        with self.lock:
+            with open(self.path, "a") as f:
+                for email, message_id, recruiter_id in entries:
+                    key = self.key(template, email)
+                    f.write(
+                        json.dumps(
+                            {
+                                "key": key,
+                                "recruiter_id": recruiter_id,
+                                "message_id": message_id,
+                                "sent_at": int(time.time()),
+                            }
+                        )
+                        + "\n"
+                    )
+                    self.sent.add(key)
+                f.flush()
+                os.fsync(f.fileno())
@@ -0,0 +1,108 @@
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import boto3
+from botocore.exceptions import ClientError
+
+from .templates import render_template_data
+from .token_bucket import TokenBucket
+
+# SES accepts at most 50 destinations per SendBulkTemplatedEmail call
+MAX_BULK_DESTINATIONS = 50
+
+
+def create_ses_client(config):
+    """Create an SES client; SES_ENDPOINT_URL points it at a local SES stand-in"""
+    return boto3.client(
+        "ses",
+        region_name=config["AWS_REGION"],
+        aws_access_key_id=config["AWS_ACCESS_KEY"],
+        aws_secret_access_key=config["AWS_SECRET_KEY"],
+        endpoint_url=config.get("SES_ENDPOINT_URL") or None,
+    )
+
+
+def ensure_template(ses, template):
+    """Create the SES template, or update it if it already exists"""
+    try:
+        ses.create_template(Template=template)
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "AlreadyExists":
+            raise
+        ses.update_template(Template=template)
+
+
+def get_send_limits(ses):
+    """Return (messages per second, messages left in the 24h quota)"""
+    quota = ses.get_send_quota()
+    remaining = int(quota["Max24HourSend"] - quota["SentLast24Hours"])
+    return quota["MaxSendRate"], max(0, remaining)
+
+
+def send_batch(ses, source, template_name, batch, sender_name):
+    """Send one SendBulkTemplatedEmail call; returns (sent, failed) recipient lists"""
+    response = ses.send_bulk_templated_email(
+        Source=source,
+        Template=template_name,
+        DefaultTemplateData=json.dumps(render_template_data({}, sender_name)),
+        Destinations=[
+            {
+                "Destination": {"ToAddresses": [recipient["email"]]},
+                "ReplacementTemplateData": json.dumps(
+                    render_template_data(recipient, sender_name)
+                ),
+            }
+            for recipient in batch
+        ],
+    )
+    sent, failed = [], []
+    for recipient, status in zip(batch, response["Status"]):
+        if status.get("Status", "Success") == "Success":
+            sent.append((recipient, status.get("MessageId")))
+        else:
+            failed.append((recipient, status.get("Error") or status.get("Status")))
+    return sent, failed
+
+
+def send_outreach(
+    ses,
+    recipients,
+    sent_log,
+    source,
+    template_name,
+    sender_name,
+    send_rate,
+    senders=4,
+):
+    """Send to recipients in bulk batches from concurrent senders under a shared rate limit"""
+    batch_size = max(1, min(MAX_BULK_DESTINATIONS, int(send_rate)))
+    bucket = TokenBucket(send_rate, capacity=max(send_rate, batch_size))
+    batches = [
+        recipients[i : i + batch_size] for i in range(0, len(recipients), batch_size)
+    ]
+
+    def send(batch):
+        bucket.acquire(len(batch))
+        sent, failed = send_batch(ses, source, template_name, batch, sender_name)
+        sent_log.record(
+            template_name,
+            [(r["email"], message_id, r["recruiter_id"]) for r, message_id in sent],
+        )
+        return sent, failed
+
+    total_sent = total_failed = 0
+    with ThreadPoolExecutor(max_workers=senders) as executor:
+        futures = {executor.submit(send, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            try:
+                sent, failed = future.result()
+            except Exception as e:
+                print(f"Error sending outreach batch: {e}")
+                total_failed += len(futures[future])
+                continue
+            total_sent += len(sent)
+            total_failed += len(failed)
+            for recipient, error in failed:
+                print(f"Failed to email {recipient['email']}: {error}")
+
+    return total_sent, total_failed
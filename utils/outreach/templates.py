@@ -0,0 +1,32 @@
+DEFAULT_TEMPLATE_NAME = "recruiter-outreach-v1"
+
+# SES template; {{placeholders}} are filled per recipient from ReplacementTemplateData
+DEFAULT_TEMPLATE = {
+    "TemplateName": DEFAULT_TEMPLATE_NAME,
+    "SubjectPart": "About the {{job_title}} role at {{company_name}}",
+    "TextPart": (
+        "Hi {{first_name}},\n\n"
+        "I came across the {{job_title}} opening at {{company_name}} and would love "
+        "to help you find the right people for it.\n\n"
+        "Would you be open to a short call this week?\n\n"
+        "Best,\n{{sender_name}}"
+    ),
+    "HtmlPart": (
+        "<p>Hi {{first_name}},</p>"
+        "<p>I came across the {{job_title}} opening at {{company_name}} and would love "
+        "to help you find the right people for it.</p>"
+        "<p>Would you be open to a short call this week?</p>"
+        "<p>Best,<br>{{sender_name}}</p>"
+    ),
+}
+
+
+def render_template_data(recipient, sender_name):
+    """Build the per-recipient replacement data for the outreach template"""
+    name = (recipient.get("name") or "").strip()
+    return {
+        "first_name": name.split()[0] if name else "there",
+        "job_title": recipient.get("job_title") or "open",
+        "company_name": recipient.get("company_name") or "your company",
+        "sender_name": sender_name,
+    }
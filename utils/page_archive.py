@@ -0,0 +1,74 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+
+DEFAULT_ARCHIVE_DIR = "archive"
+
+
+class PageArchive:
+    """Compressed, content-addressed store of raw page sources.
+
+    Pages live under objects/<sha[:2]>/<sha>.html.gz and are indexed in
+    index.jsonl by kind ("job" or "company") and key (job id or company URL).
+    Identical page sources are stored once.
+    """
+
+    def __init__(self, root=DEFAULT_ARCHIVE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.html.gz")
+
+    def save(self, kind, key, html):
+        """Store a page source and index it; returns the content hash"""
+        try:
+            data = html.encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()
+            path = self._object_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with gzip.open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+
+            entry = {
+                "kind": kind,
+                "key": str(key),
+                "sha256": digest,
+                "captured_at": int(time.time()),
+            }
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            return digest
+        except Exception as e:
+            print(f"Error archiving {kind} page {key}: {e}")
+            return None
+
+    def read(self, digest):
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def entries(self, kind=None):
+        """Return the most recent index entry for every (kind, key)"""
+        latest = {}
+        try:
+            with open(self.index_path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if kind and entry["kind"] != kind:
+                        continue
+                    latest[(entry["kind"], entry["key"])] = entry
+        except FileNotFoundError:
+            pass
+        return list(latest.values())
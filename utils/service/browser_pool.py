@@ -0,0 +1,120 @@
+import os
+
+from ..accounts.session_rotator import is_logged_in
+from ..check_captcha import is_challenged
+from ..setup_driver import setup_driver
+from ..navigation.login_to_linkedin import login_to_linkedin
+
+DEFAULT_POOL_PROFILE_ROOT = os.path.join(".cache", "pool-profiles")
+
+
+class BrowserSlot:
+    """One warm, logged-in Chrome driver owned by a single service worker"""
+
+    def __init__(self, index, chrome_cfg, config, profile_root=DEFAULT_POOL_PROFILE_ROOT):
+        self.index = index
+        self.chrome_cfg = dict(chrome_cfg)
+        self.config = config
+        self.driver = None
+        self.busy = False
+
+        # Chrome locks a user data dir, so extra slots get their own
+        if index > 0 and self.chrome_cfg["CHROME_USER_DATA_DIR"]:
+            self.chrome_cfg["CHROME_USER_DATA_DIR"] = os.path.join(
+                profile_root, f"slot-{index}"
+            )
+            os.makedirs(self.chrome_cfg["CHROME_USER_DATA_DIR"], exist_ok=True)
+
+    def start(self):
+        print(f"🔧 Starting browser slot {self.index}...")
+        self.driver = setup_driver(
+            self.chrome_cfg["IS_MACOS"],
+            self.chrome_cfg["CHROME_USER_DATA_DIR"],
+            self.chrome_cfg["DEFAULT_PROFILE"],
+            self.chrome_cfg["CHROME_BINARY_PATHS"],
+            remote_debugging_port=9222 + self.index,
+            capture_network=self.chrome_cfg["CAPTURE_NETWORK"],
+        )
+        if not self.driver:
+            raise RuntimeError(f"Failed to setup Chrome driver for slot {self.index}")
+        self._login()
+
+    def _login(self):
+        # Runs in executor threads with no one at stdin, so never prompt
+        login_to_linkedin(
+            self.driver,
+            self.config["LINKEDIN_USERNAME"],
+            self.config["LINKEDIN_PASSWORD"],
+            interactive=False,
+        )
+        if is_challenged(self.driver):
+            url = self.driver.current_url
+            self.stop()
+            raise RuntimeError(
+                f"Browser slot {self.index} hit a LinkedIn security challenge at {url}"
+            )
+
+    def ensure_alive(self):
+        """Restart the driver if the browser died, and log in again if the session was lost"""
+        try:
+            if self.driver:
+                self.driver.window_handles
+        except Exception as e:
+            print(f"[WARN] Browser slot {self.index} is unresponsive, restarting: {e}")
+            self.stop()
+        if not self.driver:
+            self.start()
+            return
+
+        if is_challenged(self.driver):
+            print(
+                f"[WARN] Browser slot {self.index} is at a security challenge "
+                f"({self.driver.current_url}), restarting"
+            )
+            self.stop()
+            self.start()
+        elif not is_logged_in(self.driver):
+            print(
+                f"[WARN] Browser slot {self.index} lost its LinkedIn session "
+                f"({self.driver.current_url}), logging in again"
+            )
+            self._login()
+            if not is_logged_in(self.driver):
+                url = self.driver.current_url
+                self.stop()
+                raise RuntimeError(
+                    f"Browser slot {self.index} could not log in to LinkedIn ({url})"
+                )
+
+    def stop(self):
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"[WARN] Error closing driver for slot {self.index}: {e}")
+            self.driver = None
+
+
+class BrowserPool:
+    """Fixed set of warm browser slots, started once and reused across requests"""
+
+    def __init__(self, size, chrome_cfg, config):
+        self.slots = [BrowserSlot(i, chrome_cfg, config) for i in range(size)]
+
+    def start(self):
+        """Start every slot; slots that fail are retried by ensure_alive on their next job"""
+        for slot in self.slots:
+            try:
+                slot.start()
+            except Exception as e:
+                print(f"[WARN] Browser slot {slot.index} failed to start: {e}")
+        if not any(slot.driver for slot in self.slots):
+            raise RuntimeError("No browser slot could be started")
+
+    def stop(self):
+        for slot in self.slots:
+            slot.stop()
+
+    def stats(self):
+        busy = sum(1 for slot in self.slots if slot.busy)
+        return {"size": len(self.slots), "busy": busy, "idle": len(self.slots) - busy}
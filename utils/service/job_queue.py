@@ -0,0 +1,204 @@
+import asyncio
+import itertools
+import time
+import traceback
+import uuid
+
+from ..extraction.enrich_job import enrich_job
+from ..extraction.scrape_and_process_jobs import scrape_and_process_jobs
+
+# Finished jobs kept around for status queries
+MAX_FINISHED_JOBS = 1000
+# Seconds to let running jobs finish on shutdown before their browsers are closed
+DEFAULT_SHUTDOWN_TIMEOUT = 120
+
+
+class ScrapeJob:
+    """A queued scrape or enrichment request and its outcome"""
+
+    def __init__(self, kind, params, priority=0):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.priority = priority
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "priority": self.priority,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """Priority queue of scrape jobs shared by all browser slots; higher priority runs first"""
+
+    def __init__(self):
+        self.queue = asyncio.PriorityQueue()
+        self.jobs = {}
+        self.counter = itertools.count()
+        self.accepting = True
+        self.running = set()
+
+    def submit(self, kind, params, priority=0):
+        if not self.accepting:
+            raise RuntimeError("Service is shutting down")
+        job = ScrapeJob(kind, params, priority)
+        self.jobs[job.id] = job
+        self.queue.put_nowait((-priority, next(self.counter), job))
+        self._prune()
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def stats(self):
+        counts = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"queued": self.queue.qsize(), "jobs": counts}
+
+    def _prune(self):
+        finished = [
+            j for j in self.jobs.values() if j.status in ("done", "failed", "cancelled")
+        ]
+        if len(finished) > MAX_FINISHED_JOBS:
+            finished.sort(key=lambda j: j.finished_at)
+            for job in finished[: len(finished) - MAX_FINISHED_JOBS]:
+                del self.jobs[job.id]
+
+    def _run(self, slot, job, supabase, shared):
+        """Run a job on the slot's driver; executes in a worker thread"""
+        slot.ensure_alive()
+        if job.kind == "scrape":
+            coro = scrape_and_process_jobs(
+                slot.driver,
+                job.params["search_url"],
+                max_items=job.params["max_items"],
+                supabase=supabase,
+                network_capture=slot.chrome_cfg["CAPTURE_NETWORK"],
+                **shared,
+            )
+        else:
+            coro = enrich_job(
+                slot.driver,
+                job.params["job_id"],
+                supabase,
+                network_capture=slot.chrome_cfg["CAPTURE_NETWORK"],
+                **shared,
+            )
+        return asyncio.run(coro)
+
+    def _run_with_rotator(self, rotator, job, supabase, shared):
+        """Run a job on sessions leased from the account pool; executes in a worker thread"""
+        network_capture = rotator.chrome_cfg["CAPTURE_NETWORK"]
+        if job.kind == "scrape":
+            return asyncio.run(
+                scrape_and_process_jobs(
+                    None,
+                    job.params["search_url"],
+                    max_items=job.params["max_items"],
+                    supabase=supabase,
+                    network_capture=network_capture,
+                    rotator=rotator,
+                    **shared,
+                )
+            )
+        with rotator.session("job_views") as session:
+            if session is None:
+                raise RuntimeError("All LinkedIn accounts are out of quota or retired")
+            account, driver = session
+            rotator.pool.record(account, "job_views")
+            return asyncio.run(
+                enrich_job(
+                    driver,
+                    job.params["job_id"],
+                    supabase,
+                    network_capture=network_capture,
+                    **shared,
+                )
+            )
+
+    async def run_worker(
+        self,
+        slot,
+        supabase,
+        archive=None,
+        rotator=None,
+        missing_sections=None,
+        company_index=None,
+    ):
+        """Pull jobs off the queue forever and run them on one browser slot.
+
+        With a `rotator`, `slot` is None and each job leases an account session instead.
+        `missing_sections` and `company_index` are shared by every worker, so all
+        jobs read and update the same in-memory copies.
+        """
+        loop = asyncio.get_running_loop()
+        shared = {
+            "archive": archive,
+            "missing_sections": missing_sections,
+            "company_index": company_index,
+        }
+        while True:
+            _, _, job = await self.queue.get()
+            if not self.accepting:
+                job.status = "cancelled"
+                job.error = "Service shut down before the job started"
+                job.finished_at = time.time()
+                self.queue.task_done()
+                continue
+            job.status = "running"
+            job.started_at = time.time()
+            if slot:
+                slot.busy = True
+            if rotator:
+                future = loop.run_in_executor(
+                    None, self._run_with_rotator, rotator, job, supabase, shared
+                )
+            else:
+                future = loop.run_in_executor(None, self._run, slot, job, supabase, shared)
+            self.running.add(future)
+            try:
+                job.result = await future
+                job.status = "done"
+            except Exception as e:
+                print(f"Error running {job.kind} job {job.id}: {e}")
+                traceback.print_exc()
+                job.error = str(e)
+                job.status = "failed"
+            finally:
+                self.running.discard(future)
+                if slot:
+                    slot.busy = False
+                job.finished_at = time.time()
+                self.queue.task_done()
+
+    async def shutdown(self, workers, timeout=DEFAULT_SHUTDOWN_TIMEOUT):
+        """Stop taking jobs, give running ones up to `timeout` seconds, then stop the workers.
+
+        Cancelling a worker does not stop the executor thread running its job,
+        so browsers must only be closed after this returns.
+        """
+        self.accepting = False
+        if self.running:
+            print(f"Waiting up to {timeout}s for {len(self.running)} running job(s)...")
+            _, pending = await asyncio.wait(set(self.running), timeout=timeout)
+            if pending:
+                print(f"[WARN] {len(pending)} job(s) still running at shutdown")
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
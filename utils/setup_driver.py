@@ -7,10 +7,21 @@ from webdriver_manager.chrome import ChromeDriverManager
 from .find_chrome_binary import find_chrome_binary
 
 
-def setup_driver(is_macos, chrome_user_data_dir, default_profile, chrome_binary_paths):
+def setup_driver(
+    is_macos,
+    chrome_user_data_dir,
+    default_profile,
+    chrome_binary_paths,
+    remote_debugging_port=9222,
+    capture_network=False,
+):
     """Setup Chrome driver with macOS-optimized configuration"""
     options = Options()
 
+    # Performance logging exposes network events for reading LinkedIn's API responses
+    if capture_network:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
     # macOS-specific Chrome options
     if is_macos:
         # Use macOS Chrome profile path
@@ -18,7 +29,7 @@ def setup_driver(is_macos, chrome_user_data_dir, default_profile, chrome_binary_
             print(os.listdir(chrome_user_data_dir))
             options.add_argument(f"--user-data-dir={chrome_user_data_dir}")
             options.add_argument(f"--profile-directory={default_profile}")
-            options.add_argument("--remote-debugging-port=9222")
+            options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
             options.add_argument("--disable-blink-features=AutomationControlled")
             options.add_argument(
                 "--no-first-run --no-service-autorun --password-store=basic --no-default-browser-check"
@@ -29,6 +40,11 @@ def setup_driver(is_macos, chrome_user_data_dir, default_profile, chrome_binary_
         if chrome_binary:
             options.binary_location = chrome_binary
             print(f"✅ Using Chrome binary: {chrome_binary}")
+    elif chrome_user_data_dir:
+        # Dedicated profile dir, e.g. one per account in the account pool
+        options.add_argument(f"--user-data-dir={chrome_user_data_dir}")
+        options.add_argument(f"--profile-directory={default_profile}")
+        options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
 
     try:
         driver_path = ChromeDriverManager().install()
@@ -43,8 +59,9 @@ def setup_driver(is_macos, chrome_user_data_dir, default_profile, chrome_binary_
 
         # Create driver instance
         driver = webdriver.Chrome(service=service, options=options)
+        if capture_network:
+            driver.execute_cdp_cmd("Network.enable", {})
 
- 
         print("✅ Chrome driver setup successful")
         return driver
 